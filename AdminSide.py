@@ -1,44 +1,243 @@
 import os
+import shutil
+import threading
+
+from Archive import CLOSED, DEFAULT_DAYS, ComplaintArchive, cutoff_date, is_archivable
+from FileLock import atomic_write, generation, locked, mark_replaced, stage_write
+from Records import ParseErrors, parse_change, parse_line, parse_records, to_id, to_status
+from Repository import ENCODING, ComplaintRepository
+from StudentSide import IdAllocator
 
 class FileManager:
-    def __init__(self, filename="complaints_data.txt"):
+    """Admin CRUD over the TXT database.
+
+    With log_mode=True, status updates and deletes are appended to a small
+    change log (<data>.log) as "U|id|status" / "D|id" records instead of
+    rewriting the whole data file. read_all() streams the merged view, and a
+    background compaction folds the log back into the data file once it grows
+    past compact_min_bytes and compact_ratio of the data file size.
+
+    Reads go through a ComplaintRepository, so lookups by ID or roll number
+    do not re-read and re-parse the file on every call. Records are
+    Records.Complaint tuples. Closed complaints can be moved out to the
+    compressed archive (see Archive); find_by_roll still returns them. Every
+    mutation holds the data file lock (see FileLock), so several U-CMS
+    instances can share one complaints_data.txt."""
+    def __init__(self, filename="complaints_data.txt", log_mode=False,
+                 compact_min_bytes=64 * 1024, compact_ratio=0.25):
         self.filename = filename
+        self.log_file = filename + ".log"
+        self.log_mode = log_mode
+        self.compact_min_bytes = compact_min_bytes
+        self.compact_ratio = compact_ratio
+        self._compactor = None
+        self.repository = ComplaintRepository(filename)
+        self.ids = IdAllocator(filename)
+        self.cold = ComplaintArchive(filename)
 
     def read_all(self):
-        if not os.path.exists(self.filename):
-            return []
-        with open(self.filename, "r") as f:
-            return f.readlines()
+        """Streams every complaint from the files; memory stays flat however
+        large the file is. records() returns the cached list instead."""
+        return self.iter_records()
+
+    def records(self):
+        return self.repository.all()
+
+    def get(self, complaint_id):
+        return self.repository.get(complaint_id)
+
+    def find_by_roll(self, roll_no):
+        return self.cold.with_archived(self.repository.find_by_roll(roll_no), roll_no)
 
     def update_status(self, complaint_id, new_status):
-        lines = self.read_all()
-        new_lines = []
-        found = False
-        for line in lines:
-            parts = line.strip().split('|')
-            if parts[0] == str(complaint_id):
-                parts[5] = new_status
-                found = True
-                line = "|".join(parts) + "\n"
-            new_lines.append(line)
-        if found:
-            with open(self.filename, "w") as f:
-                f.writelines(new_lines)
-            return True
-        return False
+        return self.update_status_many({complaint_id: new_status}) > 0
 
     def delete_complaint(self, complaint_id):
-        lines = self.read_all()
-        new_lines = []
-        found = False
-        for line in lines:
-            parts = line.strip().split('|')
-            if parts[0] != str(complaint_id):
-                new_lines.append(line)
+        return self.delete_many([complaint_id]) > 0
+
+    # --- BATCH OPERATIONS ---
+    def update_status_many(self, changes):
+        """Applies {complaint_id: new_status} in one pass over the files and
+        returns how many complaints were updated. Unknown IDs are skipped;
+        an unknown status raises ValueError before anything is written."""
+        return self._apply({complaint_id: to_status(status) for complaint_id, status in changes.items()})
+
+    def delete_many(self, complaint_ids):
+        """Deletes every listed complaint in one pass; returns how many existed."""
+        return self._apply(dict.fromkeys(complaint_ids))
+
+    def _apply(self, changes):
+        # One lock hold for the whole batch: in log mode a single append of K
+        # records, otherwise a single streaming rewrite of the data file.
+        with locked(self.filename):
+            changes = {to_id(k): v for k, v in changes.items()}
+            found = self.repository.existing(changes)
+            if not found:
+                return 0
+            changes = {complaint_id: changes[complaint_id] for complaint_id in found}
+            if self.log_mode:
+                with open(self.log_file, "a") as f:
+                    f.writelines(f"D|{complaint_id}\n" if status is None else f"U|{complaint_id}|{status.value}\n"
+                                 for complaint_id, status in changes.items())
             else:
-                found = True
-        if found:
-            with open(self.filename, "w") as f:
-                f.writelines(new_lines)
-            return True
-        return False
\ No newline at end of file
+                self._rewrite(changes)
+        if self.log_mode:
+            self._maybe_compact()
+        return len(found)
+
+    def iter_records(self):
+        """Streams Complaint records straight from the files with the change
+        log applied, without building the cache. Malformed lines are counted
+        and reported when the stream ends. Writers wait until the generator is
+        exhausted or closed."""
+        errors = ParseErrors()
+        with locked(self.filename, exclusive=False):
+            changes = self._read_log()
+            try:
+                f = open(self.filename, "r")
+            except FileNotFoundError:
+                return
+            with f:
+                for record in parse_records(f, errors):
+                    status = changes.get(record.id, record.status)
+                    if status is not None:
+                        yield record._replace(status=status)
+        errors.report(self.filename)
+
+    # --- ARCHIVING ---
+    def archive(self, older_than_days=DEFAULT_DAYS, statuses=CLOSED, today=None):
+        """Moves complaints with one of `statuses` filed at least
+        older_than_days ago into the archive; returns how many were moved.
+
+        The segments and manifest are written first and the hot file is
+        rewritten after, all under the data file lock. A crash in between
+        leaves the records in both places, which find_by_roll and the next
+        pass both tolerate."""
+        cutoff = cutoff_date(older_than_days, today)
+        statuses = {to_status(s) for s in statuses}
+        with locked(self.filename):
+            moved = [r for r in self.repository.all() if is_archivable(r, cutoff, statuses)]
+            if not moved:
+                return 0
+            self.cold.add(moved)
+            self._rewrite(dict.fromkeys(r.id for r in moved))
+        return len(moved)
+
+    # --- CHANGE LOG ---
+    def _read_log(self):
+        try:
+            with open(self.log_file, "r") as f:
+                return self._parse_log(f.read())
+        except FileNotFoundError:
+            return {}
+
+    def _parse_log(self, text):
+        """Returns {id: Status} with None marking a deleted complaint."""
+        changes = {}
+        for line in text.splitlines():
+            change = parse_change(line)
+            if change is not None and changes.get(change[0], "") is not None:
+                changes[change[0]] = change[1]
+        return changes
+
+    def _merge(self, lines, changes):
+        """Yields the data lines with the changes applied, one at a time.
+        Malformed lines are passed through untouched: rewriting the file is
+        not the place to throw data away."""
+        for line in lines:
+            record = parse_line(line)
+            if record is not None and record.id in changes:
+                status = changes[record.id]
+                if status is None:
+                    continue
+                line = record._replace(status=status).to_line()
+            yield line
+
+    def _rewrite(self, changes):
+        # Streams the data file through _merge into the replacement file, so a
+        # rewrite never holds the whole file in memory. It folds in every
+        # logged change as well, so the log goes too. Swapping in a new file
+        # (rather than truncating in place) is what lets the repository tell
+        # a rewrite apart from an append.
+        with locked(self.filename):
+            self.ids.pin()
+            pending = self._read_log()
+            for complaint_id, status in changes.items():
+                if pending.get(complaint_id, "") is not None:
+                    pending[complaint_id] = status
+            with open(self.filename, "r") as f:
+                atomic_write(self.filename, self._merge(f, pending))
+            if os.path.exists(self.log_file):
+                os.remove(self.log_file)
+            mark_replaced(self.filename)
+
+    # --- COMPACTION ---
+    def _maybe_compact(self):
+        try:
+            log_size = os.path.getsize(self.log_file)
+            data_size = os.path.getsize(self.filename)
+        except OSError:
+            return
+        if log_size < max(self.compact_min_bytes, self.compact_ratio * data_size):
+            return
+        if self._compactor and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self.compact, daemon=True)
+        self._compactor.start()
+
+    def compact(self):
+        """Folds the change log into a new snapshot of the data file.
+
+        The snapshot is streamed from the open data file through _merge into
+        a temp file without holding the lock, so memory stays flat. The lock
+        is only taken to copy over rows and log records appended in the
+        meantime and swap the new snapshot in. If another process replaced
+        either file first (its generation token changed), the pass is
+        abandoned."""
+        with locked(self.filename, exclusive=False):
+            gen = generation(self.filename)
+            try:
+                with open(self.log_file, "r") as f:
+                    changes = self._parse_log(f.read())
+                    log_pos = f.tell()
+                data = open(self.filename, "rb")
+            except OSError:
+                return False
+            data_pos = os.fstat(data.fileno()).st_size
+
+        with data:
+            # `data` keeps the old inode open: its first data_pos bytes are
+            # the snapshot, anything after them was appended since.
+            tmp = stage_write(self.filename, self._merge(_read_lines(data, data_pos), changes))
+            try:
+                with locked(self.filename):
+                    if generation(self.filename) != gen:
+                        return False
+                    self.ids.pin()
+                    with open(tmp, "ab") as out:
+                        data.seek(data_pos)
+                        shutil.copyfileobj(data, out)
+                        out.flush()
+                        os.fsync(out.fileno())
+                    with open(self.log_file, "r") as f:
+                        f.seek(log_pos)
+                        log_tail = f.read()
+                    os.replace(tmp, self.filename)
+                    if log_tail:
+                        atomic_write(self.log_file, [log_tail])
+                    else:
+                        os.remove(self.log_file)
+                    mark_replaced(self.filename)
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+        return True
+
+def _read_lines(f, size):
+    """Decoded lines from the first `size` bytes of binary file f."""
+    while size > 0:
+        line = f.readline(size)
+        if not line:
+            return
+        size -= len(line)
+        yield line.decode(ENCODING)
@@ -0,0 +1,103 @@
+import colorsys
+
+def color_ramp(steps=1000, frame_ms=50):
+    """The background pulse as [(color, duration_ms), ...] for one cycle.
+
+    Same curve as the old 20 Hz loop (1000 frames of 50 ms), but consecutive
+    frames that round to the same hex color are merged, so a cycle is a few
+    dozen redraws instead of a thousand."""
+    frames = []
+    for i in range(1, steps + 1):
+        phase = i / steps
+        rgb = colorsys.hsv_to_rgb(0.66, 0.5, 0.2 + (0.1 * abs(phase - 0.5)))
+        color = "#%02x%02x%02x" % (int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
+        if frames and frames[-1][0] == color:
+            frames[-1][1] += frame_ms
+        else:
+            frames.append([color, frame_ms])
+    if len(frames) > 1 and frames[0][0] == frames[-1][0]:
+        frames[0][1] += frames.pop()[1]
+    return [tuple(frame) for frame in frames]
+
+class BackgroundAnimator:
+    """Drives the window background pulse with as few wakeups as possible.
+
+    The ramp is computed once; each tick applies one color and sleeps until
+    the next visible change. The animation stops (no timer pending at all)
+    while any pause reason is set: "unfocused" and "hidden" are tracked from
+    the window's focus and map events, and callers may add their own, e.g.
+    pause("busy") during a heavy refresh. In reduced-motion mode the middle
+    color of the ramp is shown and nothing is scheduled."""
+    def __init__(self, root, apply, reduced_motion=False):
+        self.root = root
+        self.apply = apply
+        self.frames = color_ramp()
+        self.reduced_motion = reduced_motion
+        self.paused = set()
+        self.index = 0
+        self._after = None
+        self._color = None
+        self._check_pending = False
+        for event in ("<FocusIn>", "<FocusOut>", "<Map>", "<Unmap>"):
+            root.bind(event, self._window_changed, add="+")
+
+    def start(self):
+        self._show(self.frames[len(self.frames) // 2][0])
+        self._reschedule()
+
+    def pause(self, reason):
+        self.paused.add(reason)
+        self._reschedule()
+
+    def resume(self, reason):
+        self.paused.discard(reason)
+        self._reschedule()
+
+    def set_reduced_motion(self, enabled):
+        self.reduced_motion = enabled
+        if enabled:
+            self._show(self.frames[len(self.frames) // 2][0])
+        self._reschedule()
+
+    # --- SCHEDULING ---
+    def _reschedule(self):
+        should_run = not self.reduced_motion and not self.paused
+        if should_run and self._after is None:
+            self._after = self.root.after_idle(self._tick)
+        elif not should_run and self._after is not None:
+            self.root.after_cancel(self._after)
+            self._after = None
+
+    def _tick(self):
+        color, duration = self.frames[self.index]
+        self.index = (self.index + 1) % len(self.frames)
+        self._show(color)
+        self._after = self.root.after(duration, self._tick)
+
+    def _show(self, color):
+        if color != self._color:
+            self._color = color
+            self.apply(color)
+
+    # --- WINDOW STATE ---
+    def _window_changed(self, event):
+        # Focus and map events arrive for every child widget too (and focus
+        # moving between widgets is a FocusOut then a FocusIn), so look at
+        # the window itself once things have settled.
+        if not self._check_pending:
+            self._check_pending = True
+            self.root.after_idle(self._check_window)
+
+    def _check_window(self):
+        self._check_pending = False
+        try:
+            hidden = self.root.state() in ("iconic", "withdrawn")
+            focused = self.root.focus_displayof() is not None
+        except Exception:  # window is being destroyed
+            return
+        for reason, active in (("hidden", hidden), ("unfocused", not focused)):
+            if active:
+                self.paused.add(reason)
+            else:
+                self.paused.discard(reason)
+        self._reschedule()
@@ -0,0 +1,130 @@
+"""Cold storage for closed complaints.
+
+Archiving moves complaints that are Resolved or Rejected and older than a
+cut-off out of the hot data file into gzip-compressed segments, one per
+month of filing date, in a directory next to the data file:
+
+    complaints_data.txt.archive/
+        manifest.json        segment -> count, date and ID range, version
+        2025-09.txt.gz       the complaints, in the usual id|name|...|status lines
+        2025-09.rolls        sorted roll-number keys found in that segment
+
+Tracking by roll number reads the small .rolls index of each segment (once
+per segment version, then from memory) and only decompresses the segments
+that actually hold that roll number."""
+import datetime
+import gzip
+import json
+import os
+import threading
+import uuid
+
+from FileLock import atomic_write
+from Records import Status, parse_records
+
+CLOSED = (Status.RESOLVED, Status.REJECTED)
+DEFAULT_DAYS = 180
+
+class ComplaintArchive:
+    """The archive directory of one data file. Writers must hold the data
+    file lock; readers need no lock, since every file is swapped in whole."""
+    def __init__(self, data_file):
+        self.directory = data_file + ".archive"
+        self.manifest_file = os.path.join(self.directory, "manifest.json")
+        self._manifest = None
+        self._manifest_stamp = None
+        self._rolls = {}  # segment -> (version, frozenset of roll keys)
+        self._lock = threading.Lock()
+
+    # --- READING ---
+    def manifest(self):
+        """{"segments": {name: {"count", "first_date", "last_date", "min_id", "max_id", "version"}}}"""
+        with self._lock:
+            try:
+                st = os.stat(self.manifest_file)
+            except FileNotFoundError:
+                return {"segments": {}}
+            stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+            if stamp != self._manifest_stamp:
+                with open(self.manifest_file, "r", encoding="utf-8") as f:
+                    self._manifest = json.load(f)
+                self._manifest_stamp = stamp
+            return self._manifest
+
+    def find_by_roll(self, roll_no):
+        key = roll_no.strip().lower()
+        found = []
+        for name, segment in sorted(self.manifest()["segments"].items()):
+            if key in self._roll_keys(name, segment["version"]):
+                found.extend(r for r in self.read_segment(name) if r.roll_no.strip().lower() == key)
+        return found
+
+    def with_archived(self, hot, roll_no):
+        """The hot records for roll_no plus the archived ones, by ID. An
+        interrupted archive pass can leave a record in both places; the hot
+        copy wins."""
+        cold = self.find_by_roll(roll_no)
+        if not cold:
+            return hot
+        hot_ids = {r.id for r in hot}
+        return sorted(hot + [r for r in cold if r.id not in hot_ids], key=lambda r: r.id)
+
+    def read_segment(self, name):
+        """Streams the Complaint records of one segment."""
+        try:
+            with gzip.open(self._path(name, ".txt.gz"), "rt", encoding="utf-8") as f:
+                yield from parse_records(f)
+        except FileNotFoundError:
+            return
+
+    def _roll_keys(self, name, version):
+        cached = self._rolls.get(name)
+        if cached is None or cached[0] != version:
+            try:
+                with open(self._path(name, ".rolls"), "r", encoding="utf-8") as f:
+                    keys = frozenset(line.rstrip("\n") for line in f)
+            except FileNotFoundError:
+                keys = frozenset()
+            cached = self._rolls[name] = (version, keys)
+        return cached[1]
+
+    # --- WRITING ---
+    def add(self, records):
+        """Merges Complaint records into their month segments and updates the
+        manifest. A record already in a segment (same ID) is replaced, so
+        running an interrupted archive pass again is harmless."""
+        by_segment = {}
+        for record in records:
+            by_segment.setdefault(record.date.strftime("%Y-%m"), {})[record.id] = record
+        if not by_segment:
+            return 0
+        os.makedirs(self.directory, exist_ok=True)
+        manifest = json.loads(json.dumps(self.manifest()))  # a private copy to edit
+        for name, added in by_segment.items():
+            merged = {r.id: r for r in self.read_segment(name)}
+            merged.update(added)
+            ordered = [merged[i] for i in sorted(merged)]
+            atomic_write(self._path(name, ".txt.gz"), (r.to_line() for r in ordered), compress=True)
+            atomic_write(self._path(name, ".rolls"), sorted({r.roll_no.strip().lower() + "\n" for r in ordered}))
+            manifest["segments"][name] = {
+                "count": len(ordered),
+                "first_date": min(r.date for r in ordered).isoformat(),
+                "last_date": max(r.date for r in ordered).isoformat(),
+                "min_id": ordered[0].id,
+                "max_id": ordered[-1].id,
+                "version": uuid.uuid4().hex,
+            }
+        manifest["updated"] = datetime.datetime.now().isoformat(timespec="seconds")
+        atomic_write(self.manifest_file, [json.dumps(manifest, indent=2, sort_keys=True)])
+        return sum(len(added) for added in by_segment.values())
+
+    def _path(self, name, suffix):
+        return os.path.join(self.directory, name + suffix)
+
+def is_archivable(record, cutoff, statuses=CLOSED):
+    return record.status in statuses and record.date <= cutoff
+
+def cutoff_date(older_than_days, today=None):
+    if older_than_days < 0:
+        raise ValueError("The archive age must be zero or more days.")
+    return (today or datetime.date.today()) - datetime.timedelta(days=older_than_days)
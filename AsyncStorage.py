@@ -0,0 +1,61 @@
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+class AsyncStorage:
+    """Runs storage calls on a worker pool so the Tk main loop never blocks on I/O.
+
+    Tk widgets may only be touched from the main loop, so workers never call
+    back directly: finished calls are queued and drained on the main loop with
+    root.after(). Each call carries a key; while a call with the same key is
+    in flight, new requests for it are dropped (e.g. a double-clicked Refresh).
+    The default single worker keeps writes to the TXT files in order."""
+    def __init__(self, root, max_workers=1, poll_ms=30, on_busy=None, on_error=None):
+        self.root = root
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ucms-io")
+        self.poll_ms = poll_ms
+        self.on_busy = on_busy
+        self.on_error = on_error
+        self.pending = {}
+        self.finished = queue.Queue()
+        self._polling = False
+
+    def run(self, key, func, *args, on_done=None, on_error=None):
+        """Schedules func(*args). Returns False if a call with this key is already running."""
+        if key in self.pending:
+            return False
+        future = self.pool.submit(func, *args)
+        self.pending[key] = future
+        future.add_done_callback(lambda f: self.finished.put((key, f, on_done, on_error)))
+        if len(self.pending) == 1 and self.on_busy:
+            self.on_busy(True)
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+        return True
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    def _poll(self):
+        while True:
+            try:
+                key, future, on_done, on_error = self.finished.get_nowait()
+            except queue.Empty:
+                break
+            self.pending.pop(key, None)
+            error = future.exception()
+            if error is not None:
+                handler = on_error or self.on_error
+                if handler:
+                    handler(error)
+                else:
+                    print(f"Storage Error: {error}")
+            elif on_done:
+                on_done(future.result())
+
+        if self.pending:
+            self.root.after(self.poll_ms, self._poll)
+        else:
+            self._polling = False
+            if self.on_busy:
+                self.on_busy(False)
\ No newline at end of file
@@ -0,0 +1,112 @@
+import gzip
+import os
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: only threads of this process are serialized
+    fcntl = None
+
+_local = threading.local()
+_fallback_locks = {}
+_fallback_guard = threading.Lock()
+
+@contextmanager
+def locked(path, exclusive=True):
+    """Advisory lock shared by every process working on the data file `path`.
+
+    The lock lives on a separate <path>.lock file so the data file itself can
+    be swapped with os.replace while the lock is held. Re-entering the lock
+    from the same thread is a no-op, so helpers can lock without worrying
+    about their callers; asking for the exclusive lock while this thread
+    only holds the shared one raises RuntimeError (e.g. updating while
+    iterating AdminSide.FileManager.iter_records()), since upgrading in
+    place would let another writer in between."""
+    key = os.path.abspath(path)
+    held = getattr(_local, "held", None)
+    if held is None:
+        held = _local.held = {}
+    if key in held:
+        count, held_exclusive = held[key]
+        if exclusive and not held_exclusive:
+            raise RuntimeError(f"Cannot take the write lock on {path} while holding its read lock")
+        held[key] = [count + 1, held_exclusive]
+        try:
+            yield
+        finally:
+            held[key][0] -= 1
+        return
+
+    if fcntl is None:
+        with _fallback_guard:
+            lock = _fallback_locks.setdefault(key, threading.Lock())
+        lock.acquire()
+        release = lock.release
+    else:
+        fd = os.open(key + ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        def release():
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    held[key] = [1, exclusive]
+    try:
+        yield
+    finally:
+        del held[key]
+        release()
+
+def atomic_write(path, lines, compress=False):
+    """Writes lines to a temp file next to `path`, syncs it and swaps it in.
+
+    Readers see either the old file or the new one, never a truncated file,
+    and a crash half way through leaves the old file untouched. With
+    compress=True the file is written gzip-compressed."""
+    tmp = stage_write(path, lines, compress)
+    try:
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+def stage_write(path, lines, compress=False):
+    """The first half of atomic_write: writes lines to a synced temp file
+    next to `path` and returns its name. The caller swaps it in with
+    os.replace (or removes it)."""
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                               dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        try:
+            os.chmod(tmp, os.stat(path).st_mode & 0o777)
+        except OSError:
+            os.chmod(tmp, 0o644)
+        with os.fdopen(fd, "wb" if compress else "w") as f:
+            if compress:
+                with gzip.open(f, "wt", encoding="utf-8") as z:
+                    z.writelines(lines)
+            else:
+                f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        return tmp
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+def mark_replaced(path):
+    """Records that `path` (or its change log) was swapped rather than appended to.
+
+    Inode numbers are reused quickly on some filesystems, so readers that
+    cache the file compare this token instead of trusting st_ino alone."""
+    atomic_write(path + ".gen", [uuid.uuid4().hex])
+
+def generation(path):
+    try:
+        with open(path + ".gen", "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
@@ -1,17 +1,33 @@
 import customtkinter as ctk
-import colorsys
+import datetime
+import os
+from tkinter import filedialog
+
+import Profiling
+from Animation import BackgroundAnimator
+from AsyncStorage import AsyncStorage
+from TableView import DataTable, PagedTable
 
 # --- IMPORT LOGIC ---
 try:
-    from StudentSide import FileManager as StudentManager
-    from AdminSide import FileManager as TeacherManager
+    from Service import ComplaintService, STATUSES
 except ImportError:
-    print("Error: Ensure StudentSide.py and AdminSide.py are in the folder.")
+    print("Error: Ensure Service.py, Storage.py, StudentSide.py and AdminSide.py are in the folder.")
 
 # --- THEME CONFIGURATION ---
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("dark-blue")
 
+# ID, Roll No, Name, Status, Issue -> (title, minsize, weight)
+ADMIN_COLUMNS = [("ID", 50, 0), ("ROLL NO", 120, 0), ("NAME", 200, 0), ("DATE", 100, 0), ("STATUS", 120, 0), ("ISSUE", 0, 1)]
+ADMIN_SORT_KEYS = ["id", "roll_no", "name", "date", "status", "issue"]
+TRACK_COLUMNS = [("ID", 50, 0), ("Status", 100, 0), ("Issue", 0, 1)]
+
+# Timed when profiling is on (see Profiling.py); fetch_* run on the storage
+# worker, show_* are the widget updates on the main loop.
+PROFILED_HANDLERS = ["refresh_admin_data", "refresh_track_data", "handle_student_submit", "handle_admin_update",
+                     "handle_bulk_update", "fetch_admin_data", "show_admin_data", "show_track_data"]
+
 # --- CUSTOM POPUP CLASS ---
 class CustomPopup(ctk.CTkToplevel):
     def __init__(self, parent, title, message, type="info", command=None):
@@ -53,20 +69,58 @@ class CustomPopup(ctk.CTkToplevel):
             self.command()
         self.destroy()
 
+# --- DIAGNOSTICS PANEL ---
+class DiagnosticsPanel(ctk.CTkToplevel):
+    """Live profiler numbers; opened with Ctrl+Shift+D when profiling is on."""
+    def __init__(self, parent, profiler):
+        super().__init__(parent)
+        self.profiler = profiler
+        self.title("Diagnostics")
+        self.geometry("760x480")
+        self.configure(fg_color="#1a1a1a")
+
+        self.text = ctk.CTkTextbox(self, font=("Consolas", 12), fg_color="#111", wrap="none")
+        self.text.pack(fill="both", expand=True, padx=10, pady=(10, 5))
+        buttons = ctk.CTkFrame(self, fg_color="transparent")
+        buttons.pack(fill="x", padx=10, pady=(0, 10))
+        ctk.CTkButton(buttons, text="Reset", width=90, fg_color="#333", hover_color="#444", command=self.reset).pack(side="left")
+        ctk.CTkButton(buttons, text="Save Now", width=90, fg_color="#4facfe", command=profiler.dump).pack(side="left", padx=10)
+        self.update_report()
+
+    def update_report(self):
+        if not self.winfo_exists(): return
+        self.text.delete("0.0", "end")
+        self.text.insert("0.0", self.profiler.format_report())
+        self.after(1000, self.update_report)
+
+    def reset(self):
+        self.profiler.reset()
+        self.text.delete("0.0", "end")
+
 # --- MAIN APP CLASS ---
 class ComplaintSystemApp(ctk.CTk):
-    def __init__(self):
+    def __init__(self, service=None, reduced_motion=None):
         super().__init__()
 
-        self.student_logic = StudentManager()
-        self.teacher_logic = TeacherManager()
+        self.profiler = Profiling.current()
+        if self.profiler:
+            # Wrapped before any widget stores a reference to the handlers.
+            self.profiler.instrument(self, PROFILED_HANDLERS, "MainApp")
+            self.bind("<Control-Shift-D>", lambda event: DiagnosticsPanel(self, self.profiler))
+
+        self.service = service or ComplaintService()
+        self.storage = AsyncStorage(self, on_busy=self.set_busy, on_error=self.show_storage_error)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
         self.admin_authenticated = False
         
         self.title("University Complaint Management System")
         self.geometry("1250x850") 
         
-        self.hue = 0
-        self.animate_background()
+        # UCMS_REDUCED_MOTION=1 (or `ucms gui --reduced-motion`) keeps the background still.
+        if reduced_motion is None:
+            reduced_motion = os.environ.get("UCMS_REDUCED_MOTION", "") not in ("", "0")
+        self.animator = BackgroundAnimator(self, lambda color: self.configure(fg_color=color), reduced_motion)
+        self.animator.start()
 
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -88,6 +142,12 @@ class ComplaintSystemApp(ctk.CTk):
         self.status_label = ctk.CTkLabel(self.sidebar, text="● System Operational", text_color="#00f260", font=("Segoe UI", 10))
         self.status_label.pack(side="bottom", pady=20)
 
+        self.motion_switch = ctk.CTkSwitch(self.sidebar, text="Reduced motion", font=("Segoe UI", 11), text_color="#aaaaaa",
+                                           command=lambda: self.animator.set_reduced_motion(bool(self.motion_switch.get())))
+        if reduced_motion:
+            self.motion_switch.select()
+        self.motion_switch.pack(side="bottom")
+
         # Main Area
         self.main_area = ctk.CTkFrame(self, fg_color="transparent")
         self.main_area.grid(row=0, column=1, sticky="nsew", padx=20, pady=20)
@@ -95,13 +155,24 @@ class ComplaintSystemApp(ctk.CTk):
         self.show_student_view()
 
     # --- HELPERS ---
-    def animate_background(self):
-        self.hue += 0.001
-        if self.hue > 1: self.hue = 0
-        rgb = colorsys.hsv_to_rgb(0.66, 0.5, 0.2 + (0.1 * abs(self.hue - 0.5)))
-        color_hex = "#%02x%02x%02x" % (int(rgb[0]*255), int(rgb[1]*255), int(rgb[2]*255))
-        self.configure(fg_color=color_hex) 
-        self.after(50, self.animate_background)
+    def set_busy(self, busy):
+        # The background redraw would only compete with the table for the main loop.
+        if busy:
+            self.animator.pause("busy")
+            self.status_label.configure(text="● Working...", text_color="#f2c94c")
+            self.configure(cursor="watch")
+        else:
+            self.animator.resume("busy")
+            self.status_label.configure(text="● System Operational", text_color="#00f260")
+            self.configure(cursor="")
+
+    def on_close(self):
+        # Queued calls are dropped; one already writing finishes before exit.
+        self.storage.shutdown()
+        self.destroy()
+
+    def show_storage_error(self, error):
+        CustomPopup(self, "Storage Error", str(error), "error")
 
     def create_nav_button(self, text, command):
         btn = ctk.CTkButton(self.sidebar, text=text, command=command, height=50, corner_radius=10, 
@@ -135,47 +206,6 @@ class ComplaintSystemApp(ctk.CTk):
             self.issue_textbox.insert("0.0", "Describe your issue here...")
             self.issue_textbox.configure(text_color="gray")
 
-    # --- GRID TABLE BUILDER ---
-    def create_table_row(self, parent, data, is_header=False):
-        row_color = "#2b2b2b" if is_header else "transparent"
-        text_color = "white" if is_header else "#ddd"
-        font = ("Segoe UI", 13, "bold") if is_header else ("Segoe UI", 12)
-        
-        row_frame = ctk.CTkFrame(parent, fg_color=row_color, height=40 if is_header else 35, corner_radius=5 if is_header else 0)
-        row_frame.pack(fill="x", pady=2)
-        
-        row_frame.grid_columnconfigure(0, minsize=50)   # ID
-        row_frame.grid_columnconfigure(1, minsize=120)  # Roll No
-        row_frame.grid_columnconfigure(2, minsize=200)  # Name
-        row_frame.grid_columnconfigure(3, minsize=120)  # Status
-        row_frame.grid_columnconfigure(4, weight=1)     # Issue 
-
-        lbl_id = ctk.CTkLabel(row_frame, text=data[0], font=font, text_color=text_color, anchor="w")
-        lbl_id.grid(row=0, column=0, padx=10, sticky="w")
-
-        lbl_roll = ctk.CTkLabel(row_frame, text=data[1], font=font, text_color=text_color, anchor="w")
-        lbl_roll.grid(row=0, column=1, padx=10, sticky="w")
-
-        lbl_name = ctk.CTkLabel(row_frame, text=data[2], font=font, text_color=text_color, anchor="w")
-        lbl_name.grid(row=0, column=2, padx=10, sticky="w")
-
-        status_text = data[3]
-        status_color = text_color
-        if not is_header:
-            if "Resolved" in status_text: status_color = "#00f260"
-            elif "Pending" in status_text: status_color = "#f2c94c"
-            elif "Rejected" in status_text: status_color = "#ff416c"
-        
-        lbl_status = ctk.CTkLabel(row_frame, text=status_text, font=font, text_color=status_color, anchor="w")
-        lbl_status.grid(row=0, column=3, padx=10, sticky="w")
-
-        lbl_issue = ctk.CTkLabel(row_frame, text=data[4], font=font, text_color=text_color, anchor="w")
-        lbl_issue.grid(row=0, column=4, padx=10, sticky="w")
-
-        if not is_header:
-            sep = ctk.CTkFrame(parent, fg_color="#333", height=1)
-            sep.pack(fill="x")
-
     # --- STUDENT VIEW ---
     def show_student_view(self):
         self.update_sidebar_state("student") # UPDATE NAV STATE
@@ -220,8 +250,8 @@ class ComplaintSystemApp(ctk.CTk):
 
         self.results_frame = ctk.CTkFrame(right_card, fg_color="transparent")
         
-        self.track_table_frame = ctk.CTkScrollableFrame(self.results_frame, fg_color="#111", height=300)
-        self.track_table_frame.pack(fill="both", pady=20, expand=True)
+        self.track_table = DataTable(self.results_frame, TRACK_COLUMNS, status_column=1, height=300, body_color="#111")
+        self.track_table.pack(fill="both", pady=20, expand=True)
         
         action_f = ctk.CTkFrame(self.results_frame, fg_color="transparent")
         action_f.pack(fill="x")
@@ -232,47 +262,25 @@ class ComplaintSystemApp(ctk.CTk):
     def refresh_track_data(self):
         roll = self.search_roll.get()
         if not roll: return
-        
-        for widget in self.track_table_frame.winfo_children():
-            widget.destroy()
 
-        lines = self.teacher_logic.read_all()
-        found_data = [l for l in lines if len(l.split('|')) >= 3 and l.split('|')[2].lower() == roll.lower()]
+        # One lookup per roll number: a new search is not dropped while an
+        # older one runs, and show_track_data discards results for a roll
+        # number that is no longer in the box.
+        self.storage.run(("track", roll.strip().lower()), self.service.find_by_roll, roll,
+                         on_done=lambda found_data: self.show_track_data(roll, found_data))
+
+    def show_track_data(self, roll, found_data):
+        if not self.track_table.winfo_exists(): return
+        if roll.strip().lower() != self.search_roll.get().strip().lower(): return
 
         if found_data:
             self.results_frame.pack(fill="both", expand=True, padx=20, pady=10)
-            self.create_student_table_row(self.track_table_frame, ["ID", "Status", "Issue"], is_header=True)
-            for line in found_data:
-                parts = line.strip().split('|')
-                if len(parts) >= 6:
-                    self.create_student_table_row(self.track_table_frame, [parts[0], parts[5], parts[4]])
+            self.track_table.set_rows([[str(c.id), c.status.value, c.issue] for c in found_data])
         else:
             self.results_frame.pack_forget()
+            self.track_table.clear()
             CustomPopup(self, "No Records", "No complaints found for this Roll Number.", "info")
 
-    def create_student_table_row(self, parent, data, is_header=False):
-        row_color = "#2b2b2b" if is_header else "transparent"
-        text_color = "white" if is_header else "#ddd"
-        font = ("Segoe UI", 13, "bold") if is_header else ("Segoe UI", 12)
-        
-        row_frame = ctk.CTkFrame(parent, fg_color=row_color, height=35)
-        row_frame.pack(fill="x", pady=2)
-        
-        row_frame.grid_columnconfigure(0, minsize=50) # ID
-        row_frame.grid_columnconfigure(1, minsize=100) # Status
-        row_frame.grid_columnconfigure(2, weight=1)    # Issue
-
-        ctk.CTkLabel(row_frame, text=data[0], font=font, text_color=text_color, anchor="w").grid(row=0, column=0, padx=10, sticky="w")
-        
-        status_color = text_color
-        if not is_header:
-            if "Resolved" in data[1]: status_color = "#00f260"
-            elif "Pending" in data[1]: status_color = "#f2c94c"
-            elif "Rejected" in data[1]: status_color = "#ff416c"
-            
-        ctk.CTkLabel(row_frame, text=data[1], font=font, text_color=status_color, anchor="w").grid(row=0, column=1, padx=10, sticky="w")
-        ctk.CTkLabel(row_frame, text=data[2], font=font, text_color=text_color, anchor="w").grid(row=0, column=2, padx=10, sticky="w")
-
     def handle_student_submit(self):
         name = self.name_entry.get()
         roll = self.roll_entry.get()
@@ -282,8 +290,12 @@ class ComplaintSystemApp(ctk.CTk):
             CustomPopup(self, "Incomplete", "Please fill all fields.", "error")
             return
             
-        if self.student_logic.save_complaint(name, roll, issue):
+        self.storage.run("submit", self.service.save_complaint, name, roll, issue, on_done=self.on_student_submitted)
+
+    def on_student_submitted(self, saved):
+        if saved:
             CustomPopup(self, "Submitted", "Complaint logged successfully!", "success")
+            if not self.name_entry.winfo_exists(): return
             self.name_entry.delete(0, "end")
             self.roll_entry.delete(0, "end")
             self.issue_textbox.delete("0.0", "end")
@@ -296,7 +308,10 @@ class ComplaintSystemApp(ctk.CTk):
             CustomPopup(self, "Confirm Delete", "Permanently remove this record?", "confirm", command=lambda: self.perform_delete(c_id))
 
     def perform_delete(self, c_id):
-        if self.teacher_logic.delete_complaint(c_id):
+        self.storage.run(("delete", c_id), self.service.delete_complaint, c_id, on_done=self.on_student_deleted)
+
+    def on_student_deleted(self, deleted):
+        if deleted and self.track_id_input.winfo_exists():
             self.track_id_input.delete(0, "end")
             self.refresh_track_data()
 
@@ -336,14 +351,38 @@ class ComplaintSystemApp(ctk.CTk):
         stats_container = ctk.CTkFrame(self.main_area, fg_color="transparent")
         stats_container.pack(fill="x", pady=(0, 20))
         self.card_total = self.create_stat_card(stats_container, "Total Complaints", "0", "#4facfe")
+        self.card_today = self.create_stat_card(stats_container, "Filed Today", "0", "#a8edea")
         self.card_pending = self.create_stat_card(stats_container, "Pending", "0", "#ffb199")
+        self.card_progress = self.create_stat_card(stats_container, "In Progress", "0", "#f2c94c")
         self.card_resolved = self.create_stat_card(stats_container, "Resolved", "0", "#00f260")
+        self.card_rejected = self.create_stat_card(stats_container, "Rejected", "0", "#ff416c")
+
+        filter_bar = ctk.CTkFrame(self.main_area, fg_color="#1a1a1a", corner_radius=15)
+        filter_bar.pack(fill="x", pady=(0, 20))
+        self.search_entry = ctk.CTkEntry(filter_bar, placeholder_text="Search issue, name or roll no. (e.g. wifi pending)", height=36)
+        self.search_entry.pack(side="left", fill="x", expand=True, padx=(20, 10), pady=10)
+        self.search_entry.bind("<Return>", lambda event: self.apply_admin_filter())
+        self.filter_status = ctk.CTkOptionMenu(filter_bar, values=["All Statuses"] + STATUSES, width=130)
+        self.filter_status.pack(side="left", padx=5)
+        self.filter_roll = ctk.CTkEntry(filter_bar, placeholder_text="Roll No. starts with", width=140, height=36)
+        self.filter_roll.pack(side="left", padx=5)
+        self.filter_roll.bind("<Return>", lambda event: self.apply_admin_filter())
+        self.filter_from = ctk.CTkEntry(filter_bar, placeholder_text="From YYYY-MM-DD", width=130, height=36)
+        self.filter_from.pack(side="left", padx=5)
+        self.filter_to = ctk.CTkEntry(filter_bar, placeholder_text="To YYYY-MM-DD", width=130, height=36)
+        self.filter_to.pack(side="left", padx=5)
+        ctk.CTkButton(filter_bar, text="Search", width=80, fg_color="#4facfe", command=self.apply_admin_filter).pack(side="left", padx=5)
+        ctk.CTkButton(filter_bar, text="Clear", width=70, fg_color="#333", hover_color="#444", command=self.clear_admin_filter).pack(side="left", padx=(5, 20))
+        self.admin_filter = {}
 
         table_container = ctk.CTkFrame(self.main_area, fg_color="#1a1a1a", corner_radius=15)
         table_container.pack(fill="both", expand=True)
         
-        self.admin_table_frame = ctk.CTkScrollableFrame(table_container, fg_color="transparent")
-        self.admin_table_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        # Header clicks re-sort through the storage query; only the visible page becomes widgets.
+        self.admin_table = PagedTable(table_container, ADMIN_COLUMNS, self.load_admin_page, status_column=4,
+                                      selectable=True, on_select=self.on_admin_selection,
+                                      sort_keys=ADMIN_SORT_KEYS, sort=("id", False))
+        self.admin_table.pack(fill="both", expand=True, padx=10, pady=10)
 
         actions = ctk.CTkFrame(self.main_area, fg_color="#1a1a1a", height=80, corner_radius=15)
         actions.pack(fill="x", pady=(20, 0))
@@ -357,7 +396,20 @@ class ComplaintSystemApp(ctk.CTk):
         
         ctk.CTkButton(actions, text="Update Status", fg_color="#00f260", text_color="black", command=self.handle_admin_update).pack(side="left", padx=5)
         ctk.CTkButton(actions, text="Delete", fg_color="#ff416c", command=self.handle_admin_delete).pack(side="left", padx=5)
-        ctk.CTkButton(actions, text="Refresh", fg_color="#4facfe", command=self.refresh_admin_data).pack(side="right", padx=20)
+
+        # Multi-select: the same status menu applied to every checked row.
+        self.btn_update_selected = ctk.CTkButton(actions, text="Update Selected", width=120, fg_color="#00f260", text_color="black",
+                                                 state="disabled", command=self.handle_bulk_update)
+        self.btn_update_selected.pack(side="left", padx=(20, 5))
+        self.btn_delete_selected = ctk.CTkButton(actions, text="Delete Selected", width=120, fg_color="#ff416c",
+                                                 state="disabled", command=self.handle_bulk_delete)
+        self.btn_delete_selected.pack(side="left", padx=5)
+        self.selection_label = ctk.CTkLabel(actions, text="0 selected", text_color="#aaa")
+        self.selection_label.pack(side="left", padx=5)
+
+        ctk.CTkButton(actions, text="Refresh", fg_color="#4facfe", command=self.refresh_admin_data).pack(side="right", padx=(5, 20))
+        ctk.CTkButton(actions, text="Export", width=80, fg_color="#333", hover_color="#444", command=self.handle_export).pack(side="right", padx=5)
+        ctk.CTkButton(actions, text="Import", width=80, fg_color="#333", hover_color="#444", command=self.handle_import).pack(side="right", padx=5)
 
         self.refresh_admin_data()
 
@@ -370,31 +422,66 @@ class ComplaintSystemApp(ctk.CTk):
         return lbl_value
 
     def refresh_admin_data(self):
-        lines = self.teacher_logic.read_all()
-        
-        total = len(lines)
-        pending = len([l for l in lines if "Pending" in l])
-        resolved = len([l for l in lines if "Resolved" in l])
-        
-        self.card_total.configure(text=str(total))
-        self.card_pending.configure(text=str(pending))
-        self.card_resolved.configure(text=str(resolved))
+        self.admin_table.refresh()
+
+    def apply_admin_filter(self):
+        query = self.search_entry.get().strip()
+        status = self.filter_status.get()
+        date_from = self.filter_from.get().strip()
+        date_to = self.filter_to.get().strip()
+        roll_prefix = self.filter_roll.get().strip()
+        try:
+            for value in (date_from, date_to):
+                if value: datetime.date.fromisoformat(value)
+        except ValueError:
+            CustomPopup(self, "Invalid Date", "Dates must look like 2026-01-28.", "error")
+            return
 
-        for widget in self.admin_table_frame.winfo_children():
-            widget.destroy()
+        status = None if status == "All Statuses" else status
+        self.admin_filter = {"text": query, "status": status, "date_from": date_from or None,
+                             "date_to": date_to or None, "roll_prefix": roll_prefix or None}
+        self.admin_table.page = 0
+        self.refresh_admin_data()
 
-        self.create_table_row(self.admin_table_frame, ["ID", "ROLL NO", "NAME", "STATUS", "ISSUE"], is_header=True)
-        
-        for line in lines:
-            parts = line.strip().split('|')
-            if len(parts) >= 6:
-                row_data = [parts[0], parts[2], parts[1], parts[5], parts[4]]
-                self.create_table_row(self.admin_table_frame, row_data)
+    def clear_admin_filter(self):
+        for entry in (self.search_entry, self.filter_roll, self.filter_from, self.filter_to):
+            entry.delete(0, "end")
+        self.filter_status.set("All Statuses")
+        self.apply_admin_filter()
+
+    def load_admin_page(self, offset, limit):
+        admin_filter = dict(self.admin_filter)
+        admin_filter["sort"], admin_filter["descending"] = self.admin_table.sort
+        key = ("admin", offset, limit, tuple(sorted(admin_filter.items())))
+        self.storage.run(key, self.fetch_admin_data, offset, limit, admin_filter, on_done=self.show_admin_data)
+
+    def fetch_admin_data(self, offset, limit, admin_filter):
+        # Runs on the storage worker thread.
+        rows, total = self.service.query(offset=offset, limit=limit, **admin_filter)
+        return self.service.stats(), rows, total
+
+    def show_admin_data(self, result):
+        if not self.admin_table.winfo_exists(): return
+        stats, rows, total = result
+        by_status = stats["by_status"]
+
+        self.card_total.configure(text=str(stats["total"]))
+        self.card_today.configure(text=str(stats["today"]))
+        self.card_pending.configure(text=str(by_status.get("Pending", 0)))
+        self.card_progress.configure(text=str(by_status.get("In Progress", 0)))
+        self.card_resolved.configure(text=str(by_status.get("Resolved", 0)))
+        self.card_rejected.configure(text=str(by_status.get("Rejected", 0)))
+
+        self.admin_table.show_page([[str(c.id), c.roll_no, c.name, c.date.isoformat(), c.status.value, c.issue] for c in rows], total)
 
     def handle_admin_update(self):
         c_id = self.admin_id_input.get()
         status = self.status_menu.get()
-        if c_id and self.teacher_logic.update_status(c_id, status):
+        if c_id:
+            self.storage.run(("update", c_id, status), self.service.update_status, c_id, status, on_done=self.on_admin_changed)
+
+    def on_admin_changed(self, changed):
+        if changed and self.admin_id_input.winfo_exists():
             self.refresh_admin_data()
             self.admin_id_input.delete(0, "end")
 
@@ -404,10 +491,57 @@ class ComplaintSystemApp(ctk.CTk):
             CustomPopup(self, "Confirm Delete", "Permanently remove this record?", "confirm", command=lambda: self.perform_admin_delete(c_id))
 
     def perform_admin_delete(self, c_id):
-        if self.teacher_logic.delete_complaint(c_id):
+        self.storage.run(("delete", c_id), self.service.delete_complaint, c_id, on_done=self.on_admin_changed)
+
+    # --- BATCH ACTIONS ---
+    def on_admin_selection(self, selected):
+        state = "normal" if selected else "disabled"
+        self.btn_update_selected.configure(state=state)
+        self.btn_delete_selected.configure(state=state)
+        self.selection_label.configure(text=f"{len(selected)} selected")
+
+    def handle_bulk_update(self):
+        changes = dict.fromkeys(self.admin_table.selected, self.status_menu.get())
+        if changes:
+            self.storage.run(("bulk-update",), self.service.update_status_many, changes,
+                             on_done=lambda count: self.on_bulk_done(count, "updated"))
+
+    def handle_bulk_delete(self):
+        ids = list(self.admin_table.selected)
+        if ids:
+            CustomPopup(self, "Confirm Delete", f"Permanently remove {len(ids)} records?", "confirm",
+                        command=lambda: self.storage.run(("bulk-delete",), self.service.delete_many, ids,
+                                                         on_done=lambda count: self.on_bulk_done(count, "deleted")))
+
+    def on_bulk_done(self, count, verb):
+        if not self.admin_table.winfo_exists(): return
+        self.admin_table.clear_selection()
+        self.refresh_admin_data()
+        CustomPopup(self, "Done", f"{count} complaints {verb}.", "success")
+
+    def handle_import(self):
+        path = filedialog.askopenfilename(parent=self, title="Import complaints",
+                                          filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl *.ndjson")])
+        if path:
+            self.storage.run(("import", path), self.service.import_file, path, on_done=self.on_imported)
+
+    def on_imported(self, result):
+        imported, skipped = result
+        message = f"{imported} complaints imported."
+        if skipped:
+            message += f" {skipped} invalid rows were skipped."
+        CustomPopup(self, "Import Complete", message, "success")
+        if self.admin_table.winfo_exists():
             self.refresh_admin_data()
-            self.admin_id_input.delete(0, "end")
+
+    def handle_export(self):
+        path = filedialog.asksaveasfilename(parent=self, title="Export complaints", defaultextension=".csv",
+                                            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl")])
+        if path:
+            self.storage.run(("export", path), self.service.export_file, path,
+                             on_done=lambda count: CustomPopup(self, "Export Complete", f"{count} complaints written.", "success"))
 
 if __name__ == "__main__":
+    Profiling.enable_from_env()
     app = ComplaintSystemApp()
     app.mainloop()
\ No newline at end of file
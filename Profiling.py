@@ -0,0 +1,198 @@
+"""Opt-in instrumentation for finding out where the time goes.
+
+Off by default and free when off. Turn it on with UCMS_PROFILE=<file> (or
+UCMS_PROFILE=1) or `ucms --profile [--profile-file FILE]`:
+
+    UCMS_PROFILE=profile.json python MainApp.py
+    python -m ucms --profile --profile-file session.prof gui
+
+While enabled, the FileManager and repository methods (file I/O and
+parsing), the MainApp handlers and every Tk widget created or destroyed are
+counted and timed. The numbers can be viewed in the app's diagnostics panel
+(Ctrl+Shift+D) and are written as JSON when the process exits. A .prof /
+.pstats file name additionally records a cProfile of the main thread, with
+the JSON summary written next to it."""
+import atexit
+import cProfile
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+DEFAULT_PATH = "ucms-profile.json"
+
+# (module, class, methods) wrapped by enable(); generators are left out since
+# timing them would only measure their creation.
+TARGETS = [
+    ("AdminSide", "FileManager", ["records", "get", "find_by_roll", "update_status", "delete_complaint",
+                                  "update_status_many", "delete_many", "compact", "archive"]),
+    ("StudentSide", "FileManager", ["save_complaint", "save_many"]),
+    ("Repository", "ComplaintRepository", ["refresh"]),
+]
+
+_profiler = None
+
+class CallStats:
+    __slots__ = ("count", "total", "max", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=1000)  # recent latencies, for percentiles
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.samples.append(seconds)
+
+    def summary(self):
+        ordered = sorted(self.samples)
+        def pct(p):
+            return round(ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000, 3) if ordered else 0.0
+        return {
+            "calls": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": pct(0.5),
+            "p95_ms": pct(0.95),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+class Profiler:
+    """Collects call latencies and widget counts; safe to record from worker threads."""
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self.calls = {}
+        self.widgets_created = Counter()
+        self.widgets_destroyed = Counter()
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self.cprofile = cProfile.Profile() if path.endswith((".prof", ".pstats")) else None
+
+    # --- RECORDING ---
+    def record(self, name, seconds):
+        with self._lock:
+            stats = self.calls.get(name)
+            if stats is None:
+                stats = self.calls[name] = CallStats()
+            stats.add(seconds)
+
+    def wrap(self, name, func):
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start)
+        return timed
+
+    def instrument(self, target, names, prefix):
+        """Replaces target.<name> (a class or an instance) with a timed wrapper."""
+        for name in names:
+            setattr(target, name, self.wrap(f"{prefix}.{name}", getattr(target, name)))
+
+    def hook_widgets(self):
+        """Counts every Tk widget created and destroyed, by class."""
+        import tkinter
+        setup, destroy = tkinter.BaseWidget._setup, tkinter.BaseWidget.destroy
+
+        def counted_setup(widget, *args, **kwargs):
+            with self._lock:
+                self.widgets_created[type(widget).__name__] += 1
+            return setup(widget, *args, **kwargs)
+
+        def counted_destroy(widget):
+            with self._lock:
+                self.widgets_destroyed[type(widget).__name__] += 1
+            return destroy(widget)
+
+        tkinter.BaseWidget._setup = counted_setup
+        tkinter.BaseWidget.destroy = counted_destroy
+
+    # --- REPORTING ---
+    def report(self):
+        with self._lock:
+            calls = {name: stats.summary() for name, stats in self.calls.items()}
+            created, destroyed = dict(self.widgets_created), dict(self.widgets_destroyed)
+        return {
+            "started": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started)),
+            "seconds": round(time.time() - self.started, 1),
+            "calls": dict(sorted(calls.items(), key=lambda item: -item[1]["total_ms"])),
+            "widgets": {
+                "created": sum(created.values()),
+                "destroyed": sum(destroyed.values()),
+                "alive": sum(created.values()) - sum(destroyed.values()),
+                "created_by_class": created,
+                "destroyed_by_class": destroyed,
+            },
+        }
+
+    def format_report(self):
+        report = self.report()
+        lines = [f"{'call':<42}{'calls':>7}{'total ms':>11}{'mean':>9}{'p95':>9}{'max':>9}"]
+        for name, s in report["calls"].items():
+            lines.append(f"{name:<42}{s['calls']:>7}{s['total_ms']:>11.1f}{s['mean_ms']:>9.2f}{s['p95_ms']:>9.2f}{s['max_ms']:>9.2f}")
+        w = report["widgets"]
+        lines.append("")
+        lines.append(f"widgets: {w['created']} created, {w['destroyed']} destroyed, {w['alive']} alive")
+        for cls, n in sorted(w["created_by_class"].items(), key=lambda item: -item[1])[:12]:
+            lines.append(f"  {cls:<30}{n:>7} created{w['destroyed_by_class'].get(cls, 0):>7} destroyed")
+        return "\n".join(lines)
+
+    def reset(self):
+        with self._lock:
+            self.calls = {}
+            self.widgets_created.clear()
+            self.widgets_destroyed.clear()
+            self.started = time.time()
+
+    def dump(self):
+        json_path = self.path
+        try:
+            if self.cprofile:
+                self.cprofile.disable()
+                self.cprofile.dump_stats(self.path)
+                json_path = os.path.splitext(self.path)[0] + ".json"
+            with open(json_path, "w") as f:
+                json.dump(self.report(), f, indent=2)
+            # stderr, so `ucms ... --json` output stays parseable
+            print(f"Profile written to {json_path}" + (f" and {self.path}" if self.cprofile else ""), file=sys.stderr)
+        except OSError as e:
+            print(f"File Error: {e}")
+
+def enable(path=None):
+    """Starts profiling for the rest of the process; returns the Profiler.
+    Calling it again returns the one already running."""
+    global _profiler
+    if _profiler is not None:
+        return _profiler
+    if not path or path.lower() in ("1", "true", "yes"):
+        path = DEFAULT_PATH
+    _profiler = Profiler(path)
+    for module_name, class_name, methods in TARGETS:
+        cls = getattr(__import__(module_name), class_name)
+        _profiler.instrument(cls, methods, f"{module_name}.{class_name}")
+    try:
+        _profiler.hook_widgets()
+    except ImportError:  # no Tk: the CLI still gets call timings
+        pass
+    if _profiler.cprofile:
+        _profiler.cprofile.enable()
+    atexit.register(_profiler.dump)
+    return _profiler
+
+def enable_from_env():
+    value = os.environ.get("UCMS_PROFILE", "")
+    if value and value != "0":
+        return enable(value)
+    return None
+
+def current():
+    """The running Profiler, or None when profiling is off."""
+    return _profiler
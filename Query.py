@@ -0,0 +1,109 @@
+"""Filtered, sorted, paged queries over a ComplaintRepository's indexes.
+
+Filters narrow a candidate set of IDs straight from the indexes: full-text
+postings, the status buckets, the sorted roll-number keys (prefix = bisect)
+and the sorted dates (range = bisect). Nothing re-reads the file and only
+the requested page of records is looked up.
+
+The page is then taken in one of two ways, whichever touches fewer IDs:
+walk the column's sorted index and keep the candidates until the page is
+full, or pick the top offset+limit candidates with a heap."""
+import bisect
+import datetime
+import heapq
+import itertools
+
+from Records import Status, to_status
+from Search import tokenize
+
+SORT_COLUMNS = ("id", "name", "roll_no", "date", "issue", "status")
+STATUS_ORDER = {status: n for n, status in enumerate(Status)}
+
+def run_query(repo, text="", status=None, date_from=None, date_to=None, roll_prefix=None,
+              sort="id", descending=False, offset=0, limit=50):
+    """Returns (records [offset:offset+limit] in the requested order, total).
+    Ties are broken by ID in the same direction."""
+    if sort not in SORT_COLUMNS:
+        raise ValueError(f"Cannot sort by '{sort}'. Use one of: {', '.join(SORT_COLUMNS)}.")
+    candidates = None  # None means every record
+    def narrow(ids):
+        nonlocal candidates
+        candidates = set(ids) if candidates is None else candidates.intersection(ids)
+
+    for term in sorted(set(tokenize(text))):
+        narrow(repo.search_index.match(term, repo.by_status))
+        if not candidates:
+            return [], 0
+    if status:
+        narrow(repo.by_status.get(to_status(status), {}).keys())
+    if roll_prefix and roll_prefix.strip():
+        prefix = roll_prefix.strip().lower()
+        keys = _key_range(repo.roll_keys, prefix, prefix + "\uffff")
+        narrow(itertools.chain.from_iterable(repo.by_roll[k] for k in keys))
+    if date_from or date_to:
+        days = _key_range(repo.dates, _date(date_from, datetime.date.min), _date(date_to, datetime.date.max), inclusive=True)
+        narrow(itertools.chain.from_iterable(repo.by_date[d] for d in days))
+
+    total = len(repo.records) if candidates is None else len(candidates)
+    need = offset + limit
+    if not total or limit <= 0:
+        return [], total
+    # Walking the index costs about need * total_records / matches steps;
+    # the heap costs one key per match.
+    if candidates is None or need * len(repo.records) < len(candidates) ** 2:
+        if candidates is None:
+            ids = _ordered_ids(repo, sort, descending, need)
+        else:
+            ids = (i for i in _ordered_ids(repo, sort, descending, None) if i in candidates)
+        page = list(itertools.islice(ids, offset, need))
+    else:
+        pick = heapq.nlargest if descending else heapq.nsmallest
+        page = pick(need, candidates, key=_sort_key(repo, sort))[offset:]
+    return [repo.records[i] for i in page], total
+
+def _key_range(keys, low, high, inclusive=False):
+    start = bisect.bisect_left(keys, low)
+    end = bisect.bisect_right(keys, high) if inclusive else bisect.bisect_left(keys, high)
+    return keys[start:end]
+
+def _date(value, default):
+    if not value:
+        return default
+    return value if isinstance(value, datetime.date) else datetime.date.fromisoformat(value)
+
+def _sort_key(repo, sort):
+    records = repo.records
+    if sort == "id":
+        return None
+    if sort == "status":
+        return lambda i: (STATUS_ORDER[records[i].status], i)
+    if sort == "date":
+        return lambda i: (records[i].date, i)
+    index = SORT_COLUMNS.index(sort)
+    return lambda i: (records[i][index].strip().lower(), i)
+
+def _ordered_ids(repo, sort, descending, need):
+    """Yields IDs in sort order straight from the indexes; with `need` set,
+    possibly only the first `need` of them."""
+    if sort == "id":
+        # IDs are handed out in increasing order and only ever appended.
+        return reversed(repo.records) if descending else iter(repo.records)
+    if sort == "status":
+        statuses = [s for s in Status if s in repo.by_status]
+        return _buckets(repo.by_status, reversed(statuses) if descending else statuses, descending, need)
+    if sort == "date":
+        return _buckets(repo.by_date, reversed(repo.dates) if descending else repo.dates, descending, need)
+    if sort == "roll_no":
+        return _buckets(repo.by_roll, reversed(repo.roll_keys) if descending else repo.roll_keys, descending, need)
+    pairs = repo.sorted_pairs(sort)
+    return (i for _, i in (reversed(pairs) if descending else pairs))
+
+def _buckets(index, keys, descending, need):
+    for key in keys:
+        bucket = index[key]
+        # Buckets are in insertion order, not ID order; a large one only
+        # needs its first `need` IDs sorted.
+        if need is not None and len(bucket) > need:
+            yield from (heapq.nlargest if descending else heapq.nsmallest)(need, bucket)
+        else:
+            yield from sorted(bucket, reverse=descending)
@@ -0,0 +1,119 @@
+"""Typed complaint records and the one parser for the TXT database.
+
+A data line is "id|name|roll_no|date|issue|status". parse_records() turns
+lines into Complaint tuples lazily, so callers can stream a file of any size;
+lines that do not parse are counted in a ParseErrors instead of vanishing."""
+import datetime
+import sys
+from collections import namedtuple
+from enum import Enum
+
+class Status(str, Enum):
+    PENDING = "Pending"
+    IN_PROGRESS = "In Progress"
+    RESOLVED = "Resolved"
+    REJECTED = "Rejected"
+
+    def __str__(self):
+        return self.value
+
+_STATUSES = {s.value: s for s in Status}
+_DATES = {}  # complaints filed on the same day share one date object
+
+def to_status(value):
+    """Status for a stored or user-supplied value; ValueError if unknown."""
+    if isinstance(value, Status):
+        return value
+    try:
+        return _STATUSES[value.strip()]
+    except KeyError:
+        raise ValueError(f"Unknown status '{value}'. Use one of: {', '.join(_STATUSES)}.") from None
+
+def to_date(value):
+    if isinstance(value, datetime.date):
+        return value
+    date = _DATES.get(value)
+    if date is None:
+        date = _DATES[value] = datetime.date.fromisoformat(value.strip())
+    return date
+
+def clean_field(value):
+    """A user-supplied value made safe for one field of a data line: "|" is
+    replaced and line breaks and runs of whitespace become single spaces."""
+    return " ".join(str(value).replace("|", "-").split())
+
+class Complaint(namedtuple("Complaint", "id name roll_no date issue status")):
+    """One complaint: id is an int, date a datetime.date and status a Status.
+    Immutable; a status change makes a new tuple with _replace(status=...)."""
+    __slots__ = ()
+
+    @classmethod
+    def from_fields(cls, fields):
+        return cls(int(fields[0]), fields[1], fields[2], to_date(fields[3]), fields[4], to_status(fields[5]))
+
+    def fields(self):
+        return [str(self.id), self.name, self.roll_no, self.date.isoformat(), self.issue, self.status.value]
+
+    def to_line(self):
+        return "|".join(self.fields()) + "\n"
+
+class ParseErrors:
+    """Counts lines that could not be parsed and keeps the first for the report."""
+    def __init__(self):
+        self.count = 0
+        self.sample = None
+
+    def add(self, line):
+        self.count += 1
+        if self.sample is None:
+            self.sample = line.strip()[:80]
+
+    def report(self, source):
+        if self.count:
+            # stderr, so `ucms ... --json` output stays parseable
+            print(f"Data Warning: skipped {self.count} malformed line(s) in {source}, first: {self.sample!r}",
+                  file=sys.stderr)
+
+    def __bool__(self):
+        return self.count > 0
+
+def parse_line(line):
+    """Complaint for a data line, or None when it is malformed (fewer than 6
+    fields, a non-numeric ID, a bad date or an unknown status)."""
+    fields = line.rstrip("\r\n").split("|")
+    if len(fields) < 6:
+        return None
+    try:
+        return Complaint.from_fields(fields)
+    except ValueError:
+        return None
+
+def parse_records(lines, errors=None):
+    """Yields a Complaint for every line, counting malformed ones in `errors`.
+    Blank lines are not errors."""
+    for line in lines:
+        record = parse_line(line)
+        if record is not None:
+            yield record
+        elif line.strip() and errors is not None:
+            errors.add(line)
+
+def parse_change(line):
+    """(id, Status) for a "U|id|status" change-log line, (id, None) for
+    "D|id", or None when the line is malformed."""
+    fields = line.rstrip("\r\n").split("|")
+    try:
+        if fields[0] == "U" and len(fields) >= 3:
+            return int(fields[1]), to_status(fields[2])
+        if fields[0] == "D" and len(fields) >= 2:
+            return int(fields[1]), None
+    except ValueError:
+        pass
+    return None
+
+def to_id(complaint_id):
+    """Integer complaint ID from user input, or None if it is not a number."""
+    try:
+        return int(str(complaint_id).strip())
+    except ValueError:
+        return None
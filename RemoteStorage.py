@@ -0,0 +1,165 @@
+import http.client
+import itertools
+import json
+import threading
+import time
+from urllib.parse import quote, urlencode, urlsplit
+
+from Archive import CLOSED, DEFAULT_DAYS
+from Records import Complaint
+from Storage import StorageBackend
+
+DEFAULT_URL = "http://127.0.0.1:8765"
+IMPORT_BATCH = 1000
+IDEMPOTENT = ("GET", "PUT", "DELETE")
+IDLE_REUSE = 60  # seconds; well under the server's IDLE_TIMEOUT
+
+class HttpBackend(StorageBackend):
+    """Talks to a Server.ComplaintServer instead of opening the data file.
+
+    Each thread keeps one persistent HTTP/1.1 connection, so a front end
+    pays for the TCP handshake once and every call after that is a single
+    round trip to the server's warm cache. A connection the server has
+    dropped while idle is reopened and the request sent again, but only for
+    GET, PUT and DELETE: a POST may already have been applied, so it is
+    never re-sent (and goes out on a fresh connection when the kept one has
+    sat idle for a while). Any other network failure raises ConnectionError
+    (AsyncStorage shows it as a Storage Error). Input the server rejects
+    raises ValueError, as the local backends do."""
+    def __init__(self, url=DEFAULT_URL, timeout=30):
+        parts = urlsplit(url if "://" in url else "http://" + url)
+        if parts.scheme != "http" or not parts.hostname:
+            raise ValueError(f"Invalid server URL '{url}'. Use e.g. {DEFAULT_URL}.")
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.timeout = timeout
+        self._local = threading.local()
+
+    # --- TRANSPORT ---
+    def _connection(self, fresh=False):
+        conn = getattr(self._local, "conn", None)
+        if fresh or conn is None:
+            if conn is not None:
+                conn.close()
+            conn = self._local.conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        self._local.used = time.monotonic()
+        return conn
+
+    def _call(self, method, path, body=None, **params):
+        params = {k: v for k, v in params.items() if v is not None and v != ""}
+        if params:
+            path += "?" + urlencode(params)
+        payload = json.dumps(body).encode() if body is not None else None
+        headers = {"Content-Type": "application/json"} if payload is not None else {}
+        reused = getattr(self._local, "conn", None) is not None
+        retry = method in IDEMPOTENT
+        if reused and not retry and time.monotonic() - self._local.used > IDLE_REUSE:
+            self._drop_connection()
+            reused = False
+        try:
+            try:
+                response = self._send(self._connection(), method, path, payload, headers)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if not (reused and retry):
+                    raise
+                # The server closed the kept-alive connection before reading the request.
+                response = self._send(self._connection(fresh=True), method, path, payload, headers)
+        except (http.client.HTTPException, OSError) as e:
+            raise ConnectionError(f"Server Error: cannot reach {self.host}:{self.port} ({e})") from None
+        status, data = response
+        if status == 400:
+            raise ValueError(data.get("error", "Rejected by the server."))
+        if status != 200:
+            raise ConnectionError(f"Server Error {status}: {data.get('error', '')}")
+        return data["result"]
+
+    def _send(self, conn, method, path, payload, headers):
+        try:
+            conn.request(method, path, body=payload, headers=headers)
+            response = conn.getresponse()
+            data = json.loads(response.read() or b"{}")
+        except (http.client.HTTPException, OSError, ValueError):
+            self._drop_connection()
+            raise
+        if response.will_close:
+            self._drop_connection()
+        return response.status, data
+
+    def _drop_connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def close(self):
+        self._drop_connection()
+
+    # --- STORAGE BACKEND ---
+    def save_complaint(self, name, roll_no, issue):
+        return self._call("POST", "/complaints", {"name": name, "roll_no": roll_no, "issue": issue})
+
+    def get(self, complaint_id):
+        fields = self._call("GET", f"/complaints/{quote(str(complaint_id), safe='')}")
+        return Complaint.from_fields(fields) if fields else None
+
+    def find_by_roll(self, roll_no):
+        return _records(self._call("GET", f"/rolls/{quote(roll_no.strip(), safe='')}/complaints"))
+
+    def update_status(self, complaint_id, new_status):
+        return self._call("PUT", f"/complaints/{quote(str(complaint_id), safe='')}/status", {"status": str(new_status)})
+
+    def delete_complaint(self, complaint_id):
+        return self._call("DELETE", f"/complaints/{quote(str(complaint_id), safe='')}")
+
+    def update_status_many(self, changes):
+        return self._call("POST", "/complaints/status", {"changes": {str(k): str(v) for k, v in changes.items()}})
+
+    def delete_many(self, complaint_ids):
+        return self._call("POST", "/complaints/delete", {"ids": [str(i) for i in complaint_ids]})
+
+    def save_many(self, complaints):
+        saved = 0
+        complaints = iter(complaints)
+        for batch in iter(lambda: list(itertools.islice(complaints, IMPORT_BATCH)), []):
+            saved += self._call("POST", "/complaints/import", batch)["saved"]
+        return saved
+
+    def iter_records(self):
+        # A connection of its own: the server streams the export and then closes it.
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            conn.request("GET", "/complaints/export")
+            response = conn.getresponse()
+            if response.status != 200:
+                raise ConnectionError(f"Server Error {response.status}: export failed")
+            for line in response:
+                if line.strip():
+                    yield Complaint.from_fields(json.loads(line))
+        except OSError as e:
+            raise ConnectionError(f"Server Error: {e}") from None
+        finally:
+            conn.close()
+
+    def archive(self, older_than_days=DEFAULT_DAYS, statuses=CLOSED):
+        return self._call("POST", "/archive", {"older_than_days": older_than_days,
+                                               "statuses": [str(s) for s in statuses]})
+
+    def counts(self):
+        return self._call("GET", "/counts")
+
+    def stats(self, breakdown=False):
+        return self._call("GET", "/stats", breakdown=1 if breakdown else None)
+
+    def list_page(self, offset, limit):
+        data = self._call("GET", "/complaints", offset=offset, limit=limit)
+        return _records(data["records"]), data["total"]
+
+    def query(self, text="", status=None, date_from=None, date_to=None, roll_prefix=None,
+              sort="id", descending=False, offset=0, limit=50):
+        data = self._call("GET", "/complaints/query", text=text, status=status, date_from=date_from,
+                          date_to=date_to, roll_prefix=roll_prefix, sort=sort,
+                          descending=1 if descending else None, offset=offset, limit=limit)
+        return _records(data["records"]), data["total"]
+
+def _records(rows):
+    return [Complaint.from_fields(fields) for fields in rows]
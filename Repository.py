@@ -0,0 +1,257 @@
+import bisect
+import itertools
+import locale
+import os
+import threading
+
+from FileLock import generation, locked
+from Records import ParseErrors, parse_change, parse_records, to_id
+from Query import SORT_COLUMNS, run_query
+from Search import SearchIndex
+from Stats import ComplaintStats
+
+ENCODING = locale.getpreferredencoding(False)
+MERGE_BY_INSERT = 64  # up to this many new records are insorted into a column order
+
+class ComplaintRepository:
+    """Parsed, indexed view of the TXT database kept in memory.
+
+    Records are kept as Complaint tuples keyed by their int ID, with secondary
+    indexes by roll number (case-insensitive, keys kept sorted for prefix
+    lookups), by Status and by date (days kept sorted for range lookups). Every lookup first calls
+    refresh(), which compares the data file and change log against their last
+    known mtime/size and only parses the bytes appended since the last read.
+    A file that was replaced (compaction, full rewrite; see FileLock.mark_replaced)
+    or shrank is reloaded.
+    Dashboard counters (ComplaintStats) and the full-text SearchIndex are
+    maintained alongside the indexes. Lines that do not parse are counted in
+    self.errors and reported once per refresh that finds new ones.
+    Lookups are serialized with a lock so worker threads can share one instance."""
+    def __init__(self, filename="complaints_data.txt"):
+        self.filename = filename
+        self.log_file = filename + ".log"
+        self.records = {}
+        self.by_roll = {}
+        self.by_status = {}
+        self.by_date = {}
+        self.roll_keys = []  # sorted keys of by_roll
+        self.dates = []      # sorted keys of by_date
+        self._sorted = {}    # column -> ([(key, id)] sorted, {IDs added since}), built on demand
+        self.stats = ComplaintStats()
+        self.search_index = SearchIndex()
+        self.errors = ParseErrors()
+        self._data_state = None
+        self._log_state = None
+        self._generation = None
+        self._lock = threading.RLock()
+
+    # --- LOOKUPS ---
+    def all(self):
+        with self._lock:
+            self.refresh()
+            return list(self.records.values())
+
+    def get(self, complaint_id):
+        with self._lock:
+            self.refresh()
+            return self.records.get(to_id(complaint_id))
+
+    def existing(self, complaint_ids):
+        """The given IDs (as ints) that are currently on file."""
+        with self._lock:
+            self.refresh()
+            ids = (to_id(i) for i in complaint_ids)
+            return [i for i in dict.fromkeys(ids) if i in self.records]
+
+    def find_by_roll(self, roll_no):
+        with self._lock:
+            self.refresh()
+            ids = self.by_roll.get(roll_no.strip().lower(), {})
+            return [self.records[i] for i in ids]
+
+    def page(self, offset, limit):
+        """Returns (records in file order [offset:offset+limit], total)."""
+        with self._lock:
+            self.refresh()
+            rows = itertools.islice(self.records.values(), offset, offset + limit)
+            return list(rows), len(self.records)
+
+    def status_counts(self):
+        with self._lock:
+            self.refresh()
+            return {status.value: len(ids) for status, ids in self.by_status.items()}
+
+    def query(self, text="", status=None, date_from=None, date_to=None, roll_prefix=None,
+              sort="id", descending=False, offset=0, limit=50):
+        """Filtered, sorted page of records; see Query.run_query."""
+        with self._lock:
+            self.refresh()
+            return run_query(self, text, status, date_from, date_to, roll_prefix,
+                             sort, descending, offset, limit)
+
+    def sorted_pairs(self, column):
+        """[(key, id)] ordered by a text column (trimmed, case-insensitive,
+        then ID). Built on first use and kept current after that: removals
+        are deleted in place, additions are merged in on the next call."""
+        with self._lock:
+            index = SORT_COLUMNS.index(column)
+            entry = self._sorted.get(column)
+            if entry is None:
+                pairs = [(_sort_text(r, index), i) for i, r in self.records.items()]
+                pairs.sort()
+                entry = self._sorted[column] = (pairs, {})
+            pairs, added = entry
+            if added:
+                new = [(_sort_text(self.records[i], index), i) for i in added]
+                if len(new) <= MERGE_BY_INSERT:
+                    for pair in new:
+                        bisect.insort(pairs, pair)
+                else:
+                    # A large batch (an import): one timsort over the sorted
+                    # list plus the new run beats thousands of inserts.
+                    pairs.extend(new)
+                    pairs.sort()
+                added.clear()
+            return pairs
+
+    def stats_snapshot(self, breakdown=False):
+        with self._lock:
+            self.refresh()
+            stats = self.stats.snapshot(breakdown)
+            if self.errors:
+                stats["malformed"] = self.errors.count
+            return stats
+
+    # --- LOADING ---
+    def refresh(self):
+        # The shared lock keeps writers from swapping files mid-read.
+        with self._lock, locked(self.filename, exclusive=False):
+            seen = self.errors.count
+            self._refresh()
+            if self.errors.count > seen:
+                self.errors.report(self.filename)
+
+    def _refresh(self):
+        data = self._stat(self.filename)
+        log = self._stat(self.log_file)
+        if data is None:
+            self._clear()
+            return
+        gen = generation(self.filename)
+        if gen != self._generation or self._replaced(self._data_state, data) or self._replaced(self._log_state, log):
+            self._clear()
+            self._generation = gen
+        if self._data_state is None or data[:2] != self._data_state[:2]:
+            offset = self._data_state[3] if self._data_state else 0
+            text, offset = self._read_from(self.filename, offset, data)
+            for record in parse_records(text.splitlines(), self.errors):
+                self._add(record)
+            self._data_state = data[:3] + (offset,)
+        if log is not None and (self._log_state is None or log[:2] != self._log_state[:2]):
+            offset = self._log_state[3] if self._log_state else 0
+            text, offset = self._read_from(self.log_file, offset, log)
+            for line in text.splitlines():
+                change = parse_change(line)
+                if change is not None:
+                    self._apply_change(*change)
+                elif line.strip():
+                    self.errors.add(line)
+            self._log_state = log[:3] + (offset,)
+
+    def _clear(self):
+        self.records = {}
+        self.by_roll = {}
+        self.by_status = {}
+        self.by_date = {}
+        self.roll_keys = []
+        self.dates = []
+        self._sorted = {}
+        self.stats.clear()
+        self.search_index.clear()
+        self.errors = ParseErrors()
+        self._data_state = None
+        self._log_state = None
+
+    def _stat(self, path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _replaced(self, known, current):
+        """True when a file we have read from was swapped, removed or truncated."""
+        if known is None:
+            return False
+        return current is None or current[2] != known[2] or current[1] < known[3]
+
+    def _read_from(self, path, offset, state):
+        # Only whole lines are consumed; a half-written last line waits for
+        # the next refresh. A last line without a newline in a file that has
+        # not changed since `state` was taken is complete, though (a file
+        # saved by an editor that drops the final newline).
+        with open(path, "rb") as f:
+            f.seek(offset)
+            chunk = f.read()
+        end = chunk.rfind(b"\n") + 1
+        if end < len(chunk) and offset + len(chunk) == state[1] and self._stat(path) == state:
+            end = len(chunk)
+        return chunk[:end].decode(ENCODING), offset + end
+
+    # --- INDEX MAINTENANCE ---
+    def _add(self, record):
+        if record.id in self.records:
+            self._remove(record.id)
+        self.records[record.id] = record
+        self._index(self.by_roll, record.roll_no.strip().lower(), record.id, self.roll_keys)
+        self._index(self.by_date, record.date, record.id, self.dates)
+        self.by_status.setdefault(record.status, {})[record.id] = None
+        for _, added in self._sorted.values():
+            added[record.id] = None
+        self.stats.add(record)
+        self.search_index.add(record)
+
+    def _apply_change(self, complaint_id, status):
+        record = self.records.get(complaint_id)
+        if record is None:
+            return
+        if status is None:
+            self._remove(complaint_id)
+            return
+        self._unindex(self.by_status, record.status, complaint_id)
+        self.stats.change_status(record.status, status)
+        self.records[complaint_id] = record._replace(status=status)
+        self.by_status.setdefault(status, {})[complaint_id] = None
+
+    def _remove(self, complaint_id):
+        record = self.records.pop(complaint_id)
+        self._unindex(self.by_roll, record.roll_no.strip().lower(), complaint_id, self.roll_keys)
+        self._unindex(self.by_date, record.date, complaint_id, self.dates)
+        self._unindex(self.by_status, record.status, complaint_id)
+        for column, (pairs, added) in self._sorted.items():
+            if complaint_id in added:
+                del added[complaint_id]
+            else:
+                pair = (_sort_text(record, SORT_COLUMNS.index(column)), complaint_id)
+                del pairs[bisect.bisect_left(pairs, pair)]
+        self.stats.remove(record)
+        self.search_index.remove(record)
+
+    def _index(self, index, key, complaint_id, sorted_keys):
+        bucket = index.get(key)
+        if bucket is None:
+            bucket = index[key] = {}
+            bisect.insort(sorted_keys, key)
+        bucket[complaint_id] = None
+
+    def _unindex(self, index, key, complaint_id, sorted_keys=None):
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(complaint_id, None)
+            if not bucket:
+                del index[key]
+                if sorted_keys is not None:
+                    del sorted_keys[bisect.bisect_left(sorted_keys, key)]
+
+def _sort_text(record, index):
+    return record[index].strip().lower()
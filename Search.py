@@ -0,0 +1,62 @@
+import bisect
+import re
+
+TOKEN_RE = re.compile(r"\w+")
+
+def tokenize(text):
+    return [t.lower() for t in TOKEN_RE.findall(text)]
+
+class SearchIndex:
+    """In-memory inverted index over the issue, name and roll number fields.
+
+    postings maps each token to the IDs of the complaints containing it; a
+    sorted vocabulary makes prefix lookups ("wif" -> "wifi", "wifis") a
+    bisect plus a short scan. The repository calls add/remove as records come
+    and go. Status is not indexed here: it changes often and the repository
+    already has a status index, which match() consults for status words."""
+    def __init__(self):
+        self.postings = {}
+        self.vocabulary = []
+
+    def add(self, record):
+        for token in self._tokens(record):
+            ids = self.postings.get(token)
+            if ids is None:
+                ids = self.postings[token] = set()
+                bisect.insort(self.vocabulary, token)
+            ids.add(record.id)
+
+    def remove(self, record):
+        for token in self._tokens(record):
+            ids = self.postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(record.id)
+            if not ids:
+                del self.postings[token]
+                del self.vocabulary[bisect.bisect_left(self.vocabulary, token)]
+
+    def clear(self):
+        self.postings = {}
+        self.vocabulary = []
+
+    def match(self, term, by_status=None):
+        """IDs of complaints with a token starting with `term`, plus (when a
+        status index is given) those whose status has such a word."""
+        ids = set()
+        start = bisect.bisect_left(self.vocabulary, term)
+        for token in _with_prefix(self.vocabulary, start, term):
+            ids |= self.postings[token]
+        for status, status_ids in (by_status or {}).items():
+            if any(word.startswith(term) for word in tokenize(status.value)):
+                ids |= status_ids.keys()
+        return ids
+
+    def _tokens(self, record):
+        return set(tokenize(record.issue) + tokenize(record.name) + tokenize(record.roll_no))
+
+def _with_prefix(vocabulary, start, prefix):
+    for i in range(start, len(vocabulary)):
+        if not vocabulary[i].startswith(prefix):
+            break
+        yield vocabulary[i]
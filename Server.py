@@ -0,0 +1,263 @@
+"""Local HTTP/JSON server that owns the storage for many front ends.
+
+One process opens the TXT (or SQLite) store, keeps the parsed records,
+indexes and counters warm in memory, and answers every client from that
+cache; front ends use RemoteStorage.HttpBackend instead of opening the
+data file themselves:
+
+    python -m ucms serve --port 8765
+    UCMS_BACKEND=http UCMS_DATA=http://127.0.0.1:8765 python MainApp.py
+
+Connections are kept alive between requests. Storage calls run one at a
+time on a worker thread (the same rule AsyncStorage follows), so the event
+loop keeps accepting and parsing requests while a write is on disk.
+
+Routes (JSON bodies and responses; records are lists of Complaint.fields()):
+
+    POST   /complaints                  {"name", "roll_no", "issue"}
+    GET    /complaints?offset&limit     list_page
+    GET    /complaints/query?...        query (text, status, date_from, date_to,
+                                        roll_prefix, sort, descending, offset, limit)
+    GET    /complaints/<id>             get
+    PUT    /complaints/<id>/status      {"status"}
+    DELETE /complaints/<id>
+    POST   /complaints/status           {"changes": {id: status}}
+    POST   /complaints/delete           {"ids": [id, ...]}
+    POST   /complaints/import           [{"name", "roll_no", "issue", ...}, ...]
+    GET    /complaints/export           every record, one JSON list per line
+    GET    /rolls/<roll_no>/complaints  find_by_roll (archived complaints included)
+    POST   /archive                     {"older_than_days", "statuses"}
+    GET    /stats?breakdown=1
+    GET    /counts
+"""
+import asyncio
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from Archive import CLOSED, DEFAULT_DAYS
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_BODY = 16 * 1024 * 1024
+IDLE_TIMEOUT = 300  # seconds a kept-alive connection may sit unused
+EXPORT_BATCH = 1000
+SEND_TIMEOUT = 30  # seconds an export may wait for a client to read
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error"}
+QUERY_INTS = ("offset", "limit")
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+class ComplaintServer:
+    """Serves one ComplaintService over HTTP/1.1 with keep-alive."""
+    def __init__(self, service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.service = service
+        self.host = host
+        self.port = port
+        self.pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ucms-server")
+        self.routes = [
+            ("POST", r"/complaints", self.save_complaint),
+            ("GET", r"/complaints", self.list_page),
+            ("GET", r"/complaints/query", self.query),
+            ("POST", r"/complaints/status", self.update_status_many),
+            ("POST", r"/complaints/delete", self.delete_many),
+            ("POST", r"/complaints/import", self.save_many),
+            ("GET", r"/complaints/([^/]+)", self.get),
+            ("PUT", r"/complaints/([^/]+)/status", self.update_status),
+            ("DELETE", r"/complaints/([^/]+)", self.delete_complaint),
+            ("GET", r"/rolls/([^/]+)/complaints", self.find_by_roll),
+            ("POST", r"/archive", self.archive),
+            ("GET", r"/stats", self.stats),
+            ("GET", r"/counts", self.counts),
+        ]
+        self.routes = [(method, re.compile(pattern + "$"), handler) for method, pattern, handler in self.routes]
+
+    # --- HANDLERS (run on the storage thread) ---
+    def save_complaint(self, params, body):
+        body = _object(body)
+        return self.service.save_complaint(body.get("name", ""), body.get("roll_no", ""), body.get("issue", ""))
+
+    def list_page(self, params, body):
+        records, total = self.service.list_page(int(params.get("offset", 0)), int(params.get("limit", 50)))
+        return {"records": _rows(records), "total": total}
+
+    def query(self, params, body):
+        args = {key: int(value) if key in QUERY_INTS else value for key, value in params.items()}
+        args["descending"] = params.get("descending", "") in ("1", "true")
+        records, total = self.service.query(**args)
+        return {"records": _rows(records), "total": total}
+
+    def get(self, params, body, complaint_id):
+        record = self.service.get(complaint_id)
+        return record.fields() if record else None
+
+    def update_status(self, params, body, complaint_id):
+        return self.service.update_status(complaint_id, _object(body).get("status", ""))
+
+    def delete_complaint(self, params, body, complaint_id):
+        return self.service.delete_complaint(complaint_id)
+
+    def update_status_many(self, params, body):
+        return self.service.update_status_many(dict(_object(body).get("changes", {})))
+
+    def delete_many(self, params, body):
+        return self.service.delete_many(list(_object(body).get("ids", [])))
+
+    def save_many(self, params, body):
+        if not isinstance(body, list):
+            raise ValueError("Expected a JSON list of complaints.")
+        saved, skipped = self.service.save_many(row for row in body if isinstance(row, dict))
+        return {"saved": saved, "skipped": skipped + sum(not isinstance(row, dict) for row in body)}
+
+    def find_by_roll(self, params, body, roll_no):
+        return _rows(self.service.find_by_roll(roll_no))
+
+    def archive(self, params, body):
+        body = _object(body)
+        return self.service.archive(body.get("older_than_days", DEFAULT_DAYS), body.get("statuses", CLOSED))
+
+    def stats(self, params, body):
+        return self.service.stats(params.get("breakdown", "") in ("1", "true"))
+
+    def counts(self, params, body):
+        return self.service.backend.counts()
+
+    # --- HTTP ---
+    async def start(self):
+        # Load the cache before the first client arrives.
+        await asyncio.get_running_loop().run_in_executor(self.pool, self.service.stats)
+        self.server = await asyncio.start_server(self._serve_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"U-CMS server listening on http://{self.host}:{self.port}", flush=True)
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def _serve_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(_read_request(reader), IDLE_TIMEOUT)
+                except HttpError as e:
+                    await _respond(writer, e.status, {"error": str(e)}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, target, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                url = urlsplit(target)
+                if method == "GET" and url.path == "/complaints/export":
+                    await self._export(writer)
+                    break
+                status, payload = await self._dispatch(method, url.path, dict(parse_qsl(url.query)), body)
+                await _respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method, path, params, body):
+        # Routes match the raw path, so an encoded "/" inside a roll number
+        # stays part of its segment; the captured values are decoded after.
+        allowed = False
+        for route_method, pattern, handler in self.routes:
+            match = pattern.match(path)
+            if not match:
+                continue
+            if route_method != method:
+                allowed = True
+                continue
+            try:
+                data = json.loads(body) if body else None
+                args = [unquote(group) for group in match.groups()]
+                call = lambda: handler(params, data, *args)
+                result = await asyncio.get_running_loop().run_in_executor(self.pool, call)
+                return 200, {"result": result}
+            except (ValueError, TypeError) as e:
+                return 400, {"error": str(e)}
+            except Exception as e:
+                print(f"Server Error: {method} {path}: {e}")
+                return 500, {"error": str(e)}
+        if allowed:
+            return 405, {"error": f"{method} is not supported on {path}"}
+        return 404, {"error": f"No route for {path}"}
+
+    async def _export(self, writer):
+        """Streams every record as JSON lines, then closes the connection.
+
+        The records are copied out of the warm cache on the storage thread
+        and no lock is held while they are sent, so a slow or stalled client
+        never holds up writers. A client that stops reading for
+        SEND_TIMEOUT seconds is disconnected."""
+        records = await asyncio.get_running_loop().run_in_executor(self.pool, self.service.backend.snapshot)
+        try:
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\nConnection: close\r\n\r\n")
+            for start in range(0, len(records), EXPORT_BATCH):
+                batch = records[start:start + EXPORT_BATCH]
+                writer.write("".join(json.dumps(r.fields()) + "\n" for r in batch).encode())
+                await asyncio.wait_for(writer.drain(), SEND_TIMEOUT)
+        except asyncio.TimeoutError:
+            writer.transport.abort()
+
+def _object(body):
+    if not isinstance(body, dict):
+        raise ValueError("Expected a JSON object.")
+    return body
+
+def _rows(records):
+    return [r.fields() for r in records]
+
+async def _read_request(reader):
+    """(method, target, headers, body) for the next request, or None at EOF."""
+    line = await reader.readline()
+    if not line.strip():
+        return None
+    try:
+        method, target, _ = line.decode("latin-1").split()
+    except ValueError:
+        raise HttpError(400, "Malformed request line") from None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise HttpError(400, "Invalid Content-Length") from None
+    if length < 0:
+        raise HttpError(400, "Invalid Content-Length")
+    if length > MAX_BODY:
+        raise HttpError(413, "Request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, headers, body
+
+async def _respond(writer, status, payload, keep_alive=True):
+    body = json.dumps(payload).encode()
+    writer.write(f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                 f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + body)
+    await writer.drain()
+
+def serve(service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Runs the server until interrupted."""
+    server = ComplaintServer(service, host, port)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.pool.shutdown(wait=True)
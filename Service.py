@@ -0,0 +1,122 @@
+import datetime
+import os
+
+from Archive import CLOSED, DEFAULT_DAYS
+from Records import Status, clean_field, to_status
+from Storage import open_backend
+from Transfer import file_format, read_rows, write_rows
+
+STATUSES = [status.value for status in Status]
+
+class ComplaintService:
+    """GUI-free business layer over a storage backend.
+
+    Shared by MainApp and the `ucms` command line, so input rules live in one
+    place and scripts never have to import customtkinter. Invalid input raises
+    ValueError; storage failures are reported by return value as before."""
+    def __init__(self, backend=None):
+        self.backend = backend or open_backend()
+
+    def save_complaint(self, name, roll_no, issue):
+        name, roll_no, issue = clean_field(name), clean_field(roll_no), clean_field(issue)
+        if not name or not roll_no or not issue:
+            raise ValueError("Name, roll number and issue are all required.")
+        return self.backend.save_complaint(name, roll_no, issue)
+
+    def get(self, complaint_id):
+        return self.backend.get(complaint_id)
+
+    def find_by_roll(self, roll_no):
+        return self.backend.find_by_roll(roll_no)
+
+    def update_status(self, complaint_id, new_status):
+        if new_status not in STATUSES:
+            raise ValueError(f"Unknown status '{new_status}'. Use one of: {', '.join(STATUSES)}.")
+        return self.backend.update_status(complaint_id, new_status)
+
+    def delete_complaint(self, complaint_id):
+        return self.backend.delete_complaint(complaint_id)
+
+    def update_status_many(self, changes):
+        for new_status in set(changes.values()):
+            if new_status not in STATUSES:
+                raise ValueError(f"Unknown status '{new_status}'. Use one of: {', '.join(STATUSES)}.")
+        return self.backend.update_status_many(changes) if changes else 0
+
+    def delete_many(self, complaint_ids):
+        return self.backend.delete_many(complaint_ids) if complaint_ids else 0
+
+    def archive(self, older_than_days=DEFAULT_DAYS, statuses=CLOSED):
+        """Moves old closed complaints to the archive; returns how many moved.
+        Only Resolved and Rejected complaints may be archived, since archived
+        ones can no longer be updated."""
+        older_than_days = int(older_than_days)
+        if older_than_days < 0:
+            raise ValueError("The archive age must be zero or more days.")
+        statuses = [to_status(s) for s in statuses]
+        for status in statuses:
+            if status not in CLOSED:
+                raise ValueError(f"Only {' and '.join(s.value for s in CLOSED)} complaints can be archived, not {status.value}.")
+        return self.backend.archive(older_than_days, statuses)
+
+    # --- IMPORT / EXPORT ---
+    def import_file(self, path):
+        """Streams a .csv or .jsonl file into the store under new IDs.
+
+        Rows need name, roll_no and issue; date (YYYY-MM-DD) and status are
+        kept when valid. Returns (imported, skipped)."""
+        file_format(path)
+        if not os.path.isfile(path):
+            raise ValueError(f"No such file: {path}")
+        return self.save_many(read_rows(path))
+
+    def save_many(self, rows):
+        """Stores an iterable of dicts under new IDs, skipping rows that break
+        the import rules. Returns (saved, skipped)."""
+        skipped = 0
+        def valid_rows():
+            nonlocal skipped
+            for row in rows:
+                complaint = _import_row(row)
+                if complaint is None:
+                    skipped += 1
+                else:
+                    yield complaint
+        saved = self.backend.save_many(valid_rows())
+        return saved, skipped
+
+    def export_file(self, path):
+        """Streams every complaint into a .csv or .jsonl file; returns the count."""
+        return write_rows(path, self.backend.export_records())
+
+    def stats(self, breakdown=False):
+        return self.backend.stats(breakdown)
+
+    def list_page(self, offset=0, limit=50):
+        return self.backend.list_page(offset, limit)
+
+    def search(self, query="", status=None, date_from=None, date_to=None, offset=0, limit=50):
+        return self.backend.search(query, status, date_from, date_to, offset, limit)
+
+    def query(self, text="", status=None, date_from=None, date_to=None, roll_prefix=None,
+              sort="id", descending=False, offset=0, limit=50):
+        for value in (date_from, date_to):
+            if value:
+                try:
+                    datetime.date.fromisoformat(str(value))
+                except ValueError:
+                    raise ValueError(f"Invalid date '{value}'. Dates must look like 2026-01-28.") from None
+        return self.backend.query(text, status, date_from, date_to, roll_prefix, sort, descending, offset, limit)
+
+def _import_row(row):
+    complaint = {key: str(row.get(key) or "").strip() for key in ("name", "roll_no", "issue", "date", "status")}
+    if not complaint["name"] or not complaint["roll_no"] or not complaint["issue"]:
+        return None
+    if complaint["status"] and complaint["status"] not in STATUSES:
+        return None
+    if complaint["date"]:
+        try:
+            complaint["date"] = datetime.date.fromisoformat(complaint["date"]).isoformat()
+        except ValueError:
+            return None
+    return complaint
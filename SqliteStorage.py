@@ -0,0 +1,353 @@
+import argparse
+import datetime
+import itertools
+import sqlite3
+import threading
+
+from Archive import CLOSED, DEFAULT_DAYS, ComplaintArchive, cutoff_date
+from FileLock import locked
+from Records import Complaint, Status, clean_field, to_id, to_status
+from Repository import ComplaintRepository
+from Search import tokenize
+from Storage import StorageBackend
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS complaints (
+    id      INTEGER PRIMARY KEY AUTOINCREMENT,
+    name    TEXT NOT NULL,
+    roll_no TEXT NOT NULL,
+    date    TEXT NOT NULL,
+    issue   TEXT NOT NULL,
+    status  TEXT NOT NULL DEFAULT 'Pending'
+);
+CREATE INDEX IF NOT EXISTS idx_complaints_roll ON complaints (roll_no COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_complaints_status ON complaints (status);
+CREATE INDEX IF NOT EXISTS idx_complaints_date ON complaints (date);
+CREATE INDEX IF NOT EXISTS idx_complaints_name ON complaints (name COLLATE NOCASE);
+
+-- Dashboard counters, kept current by triggers so stats never scan complaints.
+CREATE TABLE IF NOT EXISTS complaint_counts (
+    kind TEXT NOT NULL,   -- 'status', 'day' or 'roll'
+    key  TEXT NOT NULL,
+    n    INTEGER NOT NULL,
+    PRIMARY KEY (kind, key)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS complaints_count_insert AFTER INSERT ON complaints BEGIN
+    INSERT INTO complaint_counts (kind, key, n)
+    VALUES ('status', NEW.status, 1), ('day', NEW.date, 1), ('roll', lower(trim(NEW.roll_no)), 1)
+    ON CONFLICT (kind, key) DO UPDATE SET n = n + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS complaints_count_delete AFTER DELETE ON complaints BEGIN
+    UPDATE complaint_counts SET n = n - 1 WHERE kind = 'status' AND key = OLD.status;
+    UPDATE complaint_counts SET n = n - 1 WHERE kind = 'day' AND key = OLD.date;
+    UPDATE complaint_counts SET n = n - 1 WHERE kind = 'roll' AND key = lower(trim(OLD.roll_no));
+    DELETE FROM complaint_counts WHERE n <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS complaints_count_status AFTER UPDATE OF status ON complaints
+WHEN OLD.status IS NOT NEW.status BEGIN
+    UPDATE complaint_counts SET n = n - 1 WHERE kind = 'status' AND key = OLD.status;
+    DELETE FROM complaint_counts WHERE n <= 0;
+    INSERT INTO complaint_counts (kind, key, n) VALUES ('status', NEW.status, 1)
+    ON CONFLICT (kind, key) DO UPDATE SET n = n + 1;
+END;
+"""
+
+# Full-text index over the searchable columns, kept in sync by triggers.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS complaints_fts USING fts5 (
+    issue, name, roll_no, status, content='complaints', content_rowid='id', prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS complaints_fts_insert AFTER INSERT ON complaints BEGIN
+    INSERT INTO complaints_fts (rowid, issue, name, roll_no, status)
+    VALUES (NEW.id, NEW.issue, NEW.name, NEW.roll_no, NEW.status);
+END;
+
+CREATE TRIGGER IF NOT EXISTS complaints_fts_delete AFTER DELETE ON complaints BEGIN
+    INSERT INTO complaints_fts (complaints_fts, rowid, issue, name, roll_no, status)
+    VALUES ('delete', OLD.id, OLD.issue, OLD.name, OLD.roll_no, OLD.status);
+END;
+
+CREATE TRIGGER IF NOT EXISTS complaints_fts_update AFTER UPDATE ON complaints BEGIN
+    INSERT INTO complaints_fts (complaints_fts, rowid, issue, name, roll_no, status)
+    VALUES ('delete', OLD.id, OLD.issue, OLD.name, OLD.roll_no, OLD.status);
+    INSERT INTO complaints_fts (rowid, issue, name, roll_no, status)
+    VALUES (NEW.id, NEW.issue, NEW.name, NEW.roll_no, NEW.status);
+END;
+"""
+
+REBUILD_COUNTS = """
+DELETE FROM complaint_counts;
+INSERT INTO complaint_counts (kind, key, n) SELECT 'status', status, COUNT(*) FROM complaints GROUP BY status;
+INSERT INTO complaint_counts (kind, key, n) SELECT 'day', date, COUNT(*) FROM complaints GROUP BY date;
+INSERT INTO complaint_counts (kind, key, n) SELECT 'roll', lower(trim(roll_no)), COUNT(*) FROM complaints GROUP BY 2;
+"""
+
+COLUMNS = "id, name, roll_no, date, issue, status"
+
+# Sort expressions for query(); they match the TXT backend's ordering
+# (trimmed, case-insensitive text, then ID; statuses in workflow order) as
+# long as stored text is trimmed, which writes, migration and the one-time
+# upgrade below ensure. NOCASE only folds ASCII letters, so names that
+# differ in the case of other letters (e.g. "Émile" / "émile") can still
+# sort differently from the TXT backend.
+ORDER_BY = {
+    "id": "id",
+    "name": "name COLLATE NOCASE",
+    "roll_no": "roll_no COLLATE NOCASE",
+    "date": "date",
+    "issue": "issue COLLATE NOCASE",
+    "status": "CASE status " + " ".join(f"WHEN '{s.value}' THEN {n}" for n, s in enumerate(Status)) + " END",
+}
+
+class SqliteBackend(StorageBackend):
+    """Complaint store in an SQLite database with roll number and status indexes.
+
+    The database runs in WAL mode so readers on other terminals are not
+    blocked by a writer. Queries are fixed, parameterized SQL strings, so
+    sqlite3's statement cache prepares each one once per connection.
+    AUTOINCREMENT keeps IDs from being reused after the last row is deleted."""
+    def __init__(self, path="complaints.db"):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self.cold = ComplaintArchive(path)
+        self.fts = self._create_fts()
+        # Databases created before the counters existed get them filled once.
+        if (self.conn.execute("SELECT NOT EXISTS (SELECT 1 FROM complaint_counts)").fetchone()[0]
+                and self.conn.execute("SELECT EXISTS (SELECT 1 FROM complaints)").fetchone()[0]):
+            self.rebuild_indexes()
+        # Roll-prefix queries are index range scans on roll_no and sorting
+        # uses the NOCASE indexes, so stored text must carry no stray
+        # whitespace; older databases are trimmed once.
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < 2:
+            with self.conn:
+                self.conn.execute("UPDATE complaints SET name = trim(name), roll_no = trim(roll_no), issue = trim(issue) "
+                                  "WHERE name <> trim(name) OR roll_no <> trim(roll_no) OR issue <> trim(issue)")
+                self.conn.execute("PRAGMA user_version = 2")
+
+    def _rows(self, sql, params=()):
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [Complaint.from_fields(r) for r in rows]
+
+    def _write(self, sql, params):
+        with self._lock, self.conn:
+            return self.conn.execute(sql, params).rowcount
+
+    def save_complaint(self, name, roll_no, issue):
+        try:
+            name, roll_no, issue = clean_field(name), clean_field(roll_no), clean_field(issue)
+            self._write("INSERT INTO complaints (name, roll_no, date, issue) VALUES (?, ?, ?, ?)",
+                        (name, roll_no, str(datetime.date.today()), issue))
+            return True
+        except sqlite3.Error as e:
+            print(f"Database Error: {e}")
+            return False
+
+    def get(self, complaint_id):
+        rows = self._rows(f"SELECT {COLUMNS} FROM complaints WHERE id = ?", (to_id(complaint_id),))
+        return rows[0] if rows else None
+
+    def find_by_roll(self, roll_no):
+        hot = self._rows(f"SELECT {COLUMNS} FROM complaints WHERE roll_no = ? COLLATE NOCASE ORDER BY id",
+                         (roll_no.strip(),))
+        return self.cold.with_archived(hot, roll_no)
+
+    def update_status(self, complaint_id, new_status):
+        return self._write("UPDATE complaints SET status = ? WHERE id = ?",
+                           (to_status(new_status).value, to_id(complaint_id))) > 0
+
+    def delete_complaint(self, complaint_id):
+        return self._write("DELETE FROM complaints WHERE id = ?", (to_id(complaint_id),)) > 0
+
+    def update_status_many(self, changes):
+        params = [(to_status(status).value, to_id(i)) for i, status in changes.items()]
+        with self._lock, self.conn:
+            return self.conn.executemany("UPDATE complaints SET status = ? WHERE id = ?", params).rowcount
+
+    def delete_many(self, complaint_ids):
+        with self._lock, self.conn:
+            return self.conn.executemany("DELETE FROM complaints WHERE id = ?",
+                                         ((i,) for i in {to_id(i) for i in complaint_ids})).rowcount
+
+    def save_many(self, complaints, batch_size=1000):
+        saved = 0
+        today = str(datetime.date.today())
+        rows = ((clean_field(c["name"]), clean_field(c["roll_no"]), c.get("date") or today, clean_field(c["issue"]),
+                 c.get("status") or "Pending") for c in complaints)
+        try:
+            while True:
+                batch = list(itertools.islice(rows, batch_size))
+                if not batch:
+                    break
+                with self._lock, self.conn:
+                    self.conn.executemany(
+                        "INSERT INTO complaints (name, roll_no, date, issue, status) VALUES (?, ?, ?, ?, ?)", batch)
+                saved += len(batch)
+        except sqlite3.Error as e:
+            print(f"Database Error: {e}")
+        return saved
+
+    def iter_records(self):
+        # A separate read connection sees one WAL snapshot and leaves the
+        # shared connection free for the UI while a long export runs.
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            for row in conn.execute(f"SELECT {COLUMNS} FROM complaints ORDER BY id"):
+                yield Complaint.from_fields(row)
+        finally:
+            conn.close()
+
+    def archive(self, older_than_days=DEFAULT_DAYS, statuses=CLOSED, today=None):
+        cutoff = cutoff_date(older_than_days, today).isoformat()
+        statuses = [to_status(s).value for s in statuses]
+        if not statuses:
+            return 0
+        # The file lock serializes archive passes across processes; the rows
+        # are deleted only after their segments are safely written.
+        with locked(self.path):
+            moved = self._rows(f"SELECT {COLUMNS} FROM complaints WHERE date <= ? AND status IN "
+                               f"({', '.join('?' * len(statuses))}) ORDER BY id", [cutoff] + statuses)
+            if not moved:
+                return 0
+            self.cold.add(moved)
+            with self._lock, self.conn:
+                self.conn.executemany("DELETE FROM complaints WHERE id = ?", ((r.id,) for r in moved))
+        return len(moved)
+
+    def counts(self):
+        with self._lock:
+            rows = self.conn.execute("SELECT key, n FROM complaint_counts WHERE kind = 'status'").fetchall()
+        return dict(rows)
+
+    def stats(self, breakdown=False):
+        kinds = ("status", "day", "roll") if breakdown else ("status",)
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT kind, key, n FROM complaint_counts WHERE kind IN ({', '.join('?' * len(kinds))})"
+                " OR (kind = 'day' AND key = ?)", kinds + (str(datetime.date.today()),)).fetchall()
+        grouped = {"status": {}, "day": {}, "roll": {}}
+        for kind, key, n in rows:
+            grouped[kind][key] = n
+        stats = {
+            "total": sum(grouped["status"].values()),
+            "today": grouped["day"].get(str(datetime.date.today()), 0),
+            "by_status": grouped["status"],
+        }
+        if breakdown:
+            stats["by_day"] = grouped["day"]
+            stats["by_roll"] = grouped["roll"]
+        return stats
+
+    def list_page(self, offset, limit):
+        rows = self._rows(f"SELECT {COLUMNS} FROM complaints ORDER BY id LIMIT ? OFFSET ?", (limit, offset))
+        with self._lock:
+            total = self.conn.execute(
+                "SELECT COALESCE(SUM(n), 0) FROM complaint_counts WHERE kind = 'status'").fetchone()[0]
+        return rows, total
+
+    def query(self, text="", status=None, date_from=None, date_to=None, roll_prefix=None,
+              sort="id", descending=False, offset=0, limit=50):
+        if sort not in ORDER_BY:
+            raise ValueError(f"Cannot sort by '{sort}'. Use one of: {', '.join(ORDER_BY)}.")
+        where, params = [], []
+        terms = tokenize(text)
+        if terms and self.fts:
+            where.append("id IN (SELECT rowid FROM complaints_fts WHERE complaints_fts MATCH ?)")
+            params.append(" ".join(f'"{t}"*' for t in terms))
+        for t in terms if not self.fts else []:
+            where.append("lower(issue || ' ' || name || ' ' || roll_no || ' ' || status) LIKE ?")
+            params.append(f"%{t}%")
+        if status:
+            where.append("status = ?")
+            params.append(to_status(status).value)
+        if date_from:
+            where.append("date >= ?")
+            params.append(str(date_from))
+        if date_to:
+            where.append("date <= ?")
+            params.append(str(date_to))
+        if roll_prefix and roll_prefix.strip():
+            # A range on the NOCASE index instead of LIKE, which would scan.
+            prefix = roll_prefix.strip()
+            where.append("roll_no >= ? COLLATE NOCASE AND roll_no < ? COLLATE NOCASE")
+            params.extend([prefix, prefix + "\U0010ffff"])
+        clause = " WHERE " + " AND ".join(where) if where else ""
+        direction = "DESC" if descending else "ASC"
+        order = f"{ORDER_BY[sort]} {direction}, id {direction}" if sort != "id" else f"id {direction}"
+
+        rows = self._rows(f"SELECT {COLUMNS} FROM complaints{clause} ORDER BY {order} LIMIT ? OFFSET ?",
+                          params + [limit, offset])
+        with self._lock:
+            total = self.conn.execute(f"SELECT COUNT(*) FROM complaints{clause}", params).fetchone()[0]
+        return rows, total
+
+    def rebuild_indexes(self):
+        with self._lock, self.conn:
+            for statement in REBUILD_COUNTS.strip().split(";\n"):
+                self.conn.execute(statement)
+            if self.fts:
+                self.conn.execute("INSERT INTO complaints_fts (complaints_fts) VALUES ('rebuild')")
+
+    def _create_fts(self):
+        """Sets up the FTS5 index; returns False (LIKE search) when SQLite lacks FTS5."""
+        existed = self.conn.execute(
+            "SELECT EXISTS (SELECT 1 FROM sqlite_master WHERE name = 'complaints_fts')").fetchone()[0]
+        try:
+            self.conn.executescript(FTS_SCHEMA)
+        except sqlite3.OperationalError:
+            return False
+        if not existed:
+            with self.conn:
+                self.conn.execute("INSERT INTO complaints_fts (complaints_fts) VALUES ('rebuild')")
+        return True
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+def migrate_text_to_sqlite(txt_path="complaints_data.txt", db_path="complaints.db"):
+    """Copies every complaint (change log applied) from the TXT database into
+    SQLite, keeping IDs, in one transaction, and merges the TXT archive
+    segments into the database's archive. Returns the number of rows copied."""
+    records = ComplaintRepository(txt_path).all()
+    backend = SqliteBackend(db_path)
+    try:
+        with backend._lock, backend.conn:
+            backend.conn.executemany(
+                f"INSERT OR REPLACE INTO complaints ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)",
+                ((r.id, r.name.strip(), r.roll_no.strip(), r.date.isoformat(), r.issue.strip(), r.status.value)
+                 for r in records))
+            # IDs already handed out by the TXT allocator must not come back.
+            try:
+                with open(txt_path + ".seq", "r") as f:
+                    last_id = int(f.read().strip())
+            except (OSError, ValueError):
+                last_id = 0
+            updated = backend.conn.execute(
+                "UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = 'complaints'", (last_id,)).rowcount
+            if not updated and last_id:
+                backend.conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('complaints', ?)", (last_id,))
+        # INSERT OR REPLACE does not fire the delete triggers for replaced rows.
+        backend.rebuild_indexes()
+        source = ComplaintArchive(txt_path)
+        for name in sorted(source.manifest()["segments"]):
+            backend.cold.add(source.read_segment(name))
+    finally:
+        backend.close()
+    return len(records)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate complaints_data.txt into an SQLite database.")
+    parser.add_argument("txt", nargs="?", default="complaints_data.txt")
+    parser.add_argument("db", nargs="?", default="complaints.db")
+    args = parser.parse_args()
+    count = migrate_text_to_sqlite(args.txt, args.db)
+    print(f"Migrated {count} complaints from {args.txt} to {args.db}")
\ No newline at end of file
@@ -0,0 +1,53 @@
+import datetime
+from collections import Counter
+
+class ComplaintStats:
+    """Dashboard counters kept up to date as complaints come and go.
+
+    The repository calls add/remove/change_status for every record it loads,
+    changes or drops, so reading the numbers never scans the complaints.
+    Statuses are counted by exact value (a complaint whose issue text says
+    "Resolved" is not counted as resolved)."""
+    def __init__(self):
+        self.total = 0
+        self.by_status = Counter()
+        self.by_day = Counter()
+        self.by_roll = Counter()
+
+    def add(self, record):
+        self.total += 1
+        self.by_status[record.status] += 1
+        self.by_day[record.date] += 1
+        self.by_roll[record.roll_no.strip().lower()] += 1
+
+    def remove(self, record):
+        self.total -= 1
+        self._decrement(self.by_status, record.status)
+        self._decrement(self.by_day, record.date)
+        self._decrement(self.by_roll, record.roll_no.strip().lower())
+
+    def change_status(self, old_status, new_status):
+        self._decrement(self.by_status, old_status)
+        self.by_status[new_status] += 1
+
+    def clear(self):
+        self.__init__()
+
+    def snapshot(self, breakdown=False):
+        """Returns {"total", "today", "by_status"} and, with breakdown=True,
+        the per-day and per-roll-number counts as well. Keys are plain
+        strings (status values, YYYY-MM-DD dates) so the result is JSON-ready."""
+        stats = {
+            "total": self.total,
+            "today": self.by_day.get(datetime.date.today(), 0),
+            "by_status": {status.value: n for status, n in self.by_status.items()},
+        }
+        if breakdown:
+            stats["by_day"] = {day.isoformat(): n for day, n in self.by_day.items()}
+            stats["by_roll"] = dict(self.by_roll)
+        return stats
+
+    def _decrement(self, counter, key):
+        counter[key] -= 1
+        if counter[key] <= 0:
+            del counter[key]
\ No newline at end of file
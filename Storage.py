@@ -0,0 +1,166 @@
+import os
+
+from AdminSide import FileManager as TeacherManager
+from Archive import CLOSED, DEFAULT_DAYS
+from StudentSide import FileManager as StudentManager
+
+class StorageBackend:
+    """Operations the UI needs from a complaint store.
+
+    Records are Records.Complaint tuples (int id, datetime.date, Status).
+    Every implementation must be safe to call from the AsyncStorage worker
+    thread."""
+    def save_complaint(self, name, roll_no, issue):
+        raise NotImplementedError
+
+    def get(self, complaint_id):
+        raise NotImplementedError
+
+    def find_by_roll(self, roll_no):
+        """Every complaint filed under roll_no, archived ones included, by ID."""
+        raise NotImplementedError
+
+    def update_status(self, complaint_id, new_status):
+        raise NotImplementedError
+
+    def delete_complaint(self, complaint_id):
+        raise NotImplementedError
+
+    def update_status_many(self, changes):
+        """Applies {complaint_id: new_status} as one batch; returns how many were updated."""
+        raise NotImplementedError
+
+    def delete_many(self, complaint_ids):
+        """Deletes the listed complaints as one batch; returns how many existed."""
+        raise NotImplementedError
+
+    def save_many(self, complaints):
+        """Stores dicts with name, roll_no, issue and optional date/status under
+        new IDs, consuming the iterable in batches. Returns how many were saved."""
+        raise NotImplementedError
+
+    def iter_records(self):
+        """Yields every record in ID order without loading them all at once."""
+        raise NotImplementedError
+
+    def snapshot(self):
+        """Every record as a list, taken at once and holding no lock after it
+        returns; backends with an in-memory cache copy it from there."""
+        return list(self.iter_records())
+
+    def export_records(self):
+        """The records an export writes out. Streams iter_records() unless
+        that would keep writers waiting until the export is written."""
+        return self.iter_records()
+
+    def archive(self, older_than_days=DEFAULT_DAYS, statuses=CLOSED):
+        """Moves complaints with one of `statuses` filed at least
+        older_than_days ago to the compressed archive (see Archive), where only
+        find_by_roll still sees them. Returns how many were moved."""
+        raise NotImplementedError
+
+    def counts(self):
+        """Returns {status: number of complaints}."""
+        raise NotImplementedError
+
+    def stats(self, breakdown=False):
+        """Returns {"total", "today", "by_status"}; with breakdown=True also
+        {"by_day": {date: n}, "by_roll": {roll_no: n}}. Maintained incrementally,
+        so the dashboard cards never scan the complaints."""
+        raise NotImplementedError
+
+    def list_page(self, offset, limit):
+        """Returns (records[offset:offset+limit], total)."""
+        raise NotImplementedError
+
+    def query(self, text="", status=None, date_from=None, date_to=None, roll_prefix=None,
+              sort="id", descending=False, offset=0, limit=50):
+        """Filtered, sorted page of complaints, answered from indexes.
+
+        Every word of `text` must prefix-match the issue, name, roll number or
+        status; status is exact; date_from/date_to are an inclusive YYYY-MM-DD
+        range; roll_prefix matches roll numbers case-insensitively. sort is
+        one of Query.SORT_COLUMNS (status sorts in workflow order), ties
+        broken by ID. Returns (records[offset:offset+limit], total matches)."""
+        raise NotImplementedError
+
+    def search(self, query="", status=None, date_from=None, date_to=None, offset=0, limit=50):
+        """Full-text search, newest first. Returns (matches[offset:offset+limit], total)."""
+        return self.query(query, status, date_from, date_to, sort="id", descending=True, offset=offset, limit=limit)
+
+class TextBackend(StorageBackend):
+    """The pipe-delimited complaints_data.txt format, via the two FileManagers."""
+    def __init__(self, filename="complaints_data.txt", log_mode=True):
+        self.student = StudentManager(filename)
+        self.teacher = TeacherManager(filename, log_mode=log_mode)
+
+    def save_complaint(self, name, roll_no, issue):
+        return self.student.save_complaint(name, roll_no, issue)
+
+    def get(self, complaint_id):
+        return self.teacher.get(complaint_id)
+
+    def find_by_roll(self, roll_no):
+        return self.teacher.find_by_roll(roll_no)
+
+    def update_status(self, complaint_id, new_status):
+        return self.teacher.update_status(complaint_id, new_status)
+
+    def delete_complaint(self, complaint_id):
+        return self.teacher.delete_complaint(complaint_id)
+
+    def update_status_many(self, changes):
+        return self.teacher.update_status_many(changes)
+
+    def delete_many(self, complaint_ids):
+        return self.teacher.delete_many(complaint_ids)
+
+    def save_many(self, complaints):
+        return self.student.save_many(complaints)
+
+    def iter_records(self):
+        return self.teacher.iter_records()
+
+    def snapshot(self):
+        return self.teacher.records()
+
+    def export_records(self):
+        # iter_records() holds the shared data file lock until the stream
+        # ends, blocking every writer for as long as the export file takes
+        # to write; the cache snapshot holds it only while refreshing.
+        return self.snapshot()
+
+    def archive(self, older_than_days=DEFAULT_DAYS, statuses=CLOSED):
+        return self.teacher.archive(older_than_days, statuses)
+
+    def counts(self):
+        return self.teacher.repository.status_counts()
+
+    def stats(self, breakdown=False):
+        return self.teacher.repository.stats_snapshot(breakdown)
+
+    def list_page(self, offset, limit):
+        return self.teacher.repository.page(offset, limit)
+
+    def query(self, text="", status=None, date_from=None, date_to=None, roll_prefix=None,
+              sort="id", descending=False, offset=0, limit=50):
+        return self.teacher.repository.query(text, status, date_from, date_to, roll_prefix,
+                                             sort, descending, offset, limit)
+
+def open_backend(kind=None, path=None):
+    """Creates the configured backend.
+
+    UCMS_BACKEND selects "txt" (default), "sqlite" or "http" (a `ucms serve`
+    process), and UCMS_DATA overrides the data file (complaints_data.txt /
+    complaints.db) or the server URL (http://127.0.0.1:8765)."""
+    kind = (kind or os.environ.get("UCMS_BACKEND", "txt")).lower()
+    path = path or os.environ.get("UCMS_DATA")
+    if kind == "sqlite":
+        from SqliteStorage import SqliteBackend
+        return SqliteBackend(path or "complaints.db")
+    if kind == "http":
+        from RemoteStorage import HttpBackend, DEFAULT_URL
+        return HttpBackend(path or DEFAULT_URL)
+    if kind == "txt":
+        return TextBackend(path or "complaints_data.txt")
+    raise ValueError(f"Unknown storage backend: {kind}")
\ No newline at end of file
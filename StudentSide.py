@@ -1,28 +1,121 @@
 import datetime
 import os
 
+from FileLock import atomic_write, locked
+from Records import Complaint, Status, clean_field, to_date, to_status
+
+class IdAllocator:
+    """Hands out complaint IDs from a small counter file next to the data file.
+    IDs are never reused, even when the last complaint is deleted. Callers
+    must hold the data file lock so two processes never get the same ID."""
+    def __init__(self, data_file):
+        self.data_file = data_file
+        self.counter_file = data_file + ".seq"
+
+    def next_id(self):
+        return self.reserve(1)
+
+    def reserve(self, count):
+        """Claims `count` consecutive IDs with one counter write; returns the first."""
+        last_id = self._read_counter()
+        if last_id is None:
+            last_id = self._read_last_id()
+        atomic_write(self.counter_file, [str(last_id + count)])
+        return last_id + 1
+
+    def pin(self):
+        """Creates the counter file from the data file if there is none yet.
+        Call it (under the lock) before rewriting the data file without some
+        of its rows: once the newest rows are gone, the last line no longer
+        tells which IDs were handed out."""
+        if self._read_counter() is None:
+            atomic_write(self.counter_file, [str(self._read_last_id())])
+
+    def _read_counter(self):
+        try:
+            with open(self.counter_file, "r") as f:
+                return int(f.read().strip())
+        except (OSError, ValueError):
+            return None
+
+    def _read_last_id(self):
+        # First run only: seek to the end of the data file and read backwards
+        # until we have the whole last record, instead of loading every line.
+        if not os.path.exists(self.data_file):
+            return 0
+        with open(self.data_file, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            tail = b""
+            while pos > 0:
+                step = min(4096, pos)
+                pos -= step
+                f.seek(pos)
+                tail = f.read(step) + tail
+                if tail.strip().count(b"\n") >= 1:
+                    break
+        lines = tail.strip().splitlines()
+        if not lines:
+            return 0
+        try:
+            return int(lines[-1].split(b'|')[0])
+        except ValueError:
+            return 0
+
 class FileManager:
     def __init__(self, filename="complaints_data.txt"):
         self.filename = filename
+        self.ids = IdAllocator(filename)
 
     def save_complaint(self, name, roll_no, issue):
         try:
-            last_id = 0
-            if os.path.exists(self.filename):
-                with open(self.filename, "r") as r:
-                    content = r.readlines()
-                    if content:
-                        last_line = content[-1]
-                        last_id = int(last_line.split('|')[0])
-            
-            new_id = last_id + 1
             date = datetime.date.today()
-            issue = issue.replace("|", "-")
-            data_line = f"{new_id}|{name}|{roll_no}|{date}|{issue}|Pending\n"
-            
-            with open(self.filename, "a") as f:
-                f.write(data_line)
+            name, roll_no, issue = clean_field(name), clean_field(roll_no), clean_field(issue)
+            with locked(self.filename):
+                record = Complaint(self.ids.next_id(), name, roll_no, date, issue, Status.PENDING)
+                with open(self.filename, "a") as f:
+                    f.write(_line_break(self.filename) + record.to_line())
             return True
         except Exception as e:
             print(f"File Error: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    def save_many(self, complaints, batch_size=1000):
+        """Appends complaints from any iterable of dicts with name, roll_no and
+        issue (plus optional date and status), batch_size at a time, so a large
+        import never sits in memory. IDs are always newly allocated. Returns
+        how many were written."""
+        saved = 0
+        try:
+            batch = []
+            for complaint in complaints:
+                batch.append(complaint)
+                if len(batch) >= batch_size:
+                    saved += self._append_batch(batch)
+                    batch = []
+            if batch:
+                saved += self._append_batch(batch)
+        except Exception as e:
+            print(f"File Error: {e}")
+        return saved
+
+    def _append_batch(self, batch):
+        today = datetime.date.today()
+        fields = [(clean_field(c["name"]), clean_field(c["roll_no"]), to_date(c.get("date") or today),
+                   clean_field(c["issue"]), to_status(c.get("status") or Status.PENDING)) for c in batch]
+        with locked(self.filename):
+            first_id = self.ids.reserve(len(batch))
+            with open(self.filename, "a") as f:
+                f.write(_line_break(self.filename))
+                f.writelines(Complaint(first_id + i, *values).to_line() for i, values in enumerate(fields))
+        return len(batch)
+
+def _line_break(path):
+    """A newline to write first when the file's last line has none, so an
+    append starts a line of its own instead of running into that record."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return "" if f.read(1) == b"\n" else "\n"
+    except OSError:  # missing or empty
+        return ""
@@ -0,0 +1,259 @@
+import customtkinter as ctk
+
+STATUS_COLORS = {"Resolved": "#00f260", "Pending": "#f2c94c", "Rejected": "#ff416c"}
+
+def status_color(status, default="#ddd"):
+    for key, color in STATUS_COLORS.items():
+        if key in status:
+            return color
+    return default
+
+# --- KEYED GRID TABLE ---
+class DataTable(ctk.CTkFrame):
+    """Grid table whose rows are keyed by their first column (the complaint ID).
+
+    set_rows() diffs the new rows against what is on screen: cells whose text
+    changed are reconfigured, rows for new IDs are inserted and rows for IDs
+    that went away are hidden and kept in a free pool for reuse. Updating one
+    status therefore touches one label instead of rebuilding the grid.
+
+    With selectable=True every row gets a checkbox. The selected keys are kept
+    in self.selected across page changes, and on_select(selected) is called
+    whenever the selection changes.
+
+    sort_keys names the sort key of each column (None for unsortable ones).
+    Clicking such a header sets self.sort = (key, descending), toggling the
+    direction on a second click, and calls sort_changed(); the table never
+    sorts rows itself, the owner fetches them in the new order."""
+    def __init__(self, parent, columns, status_column=None, height=200, body_color="transparent",
+                 selectable=False, on_select=None, sort_keys=None, sort=None, on_sort=None):
+        super().__init__(parent, fg_color="transparent")
+        self.columns = columns  # [(title, minsize, weight), ...]
+        self.status_column = status_column
+        self.selectable = selectable
+        self.on_select = on_select
+        self.selected = set()
+        self.sort_keys = sort_keys or [None] * len(columns)
+        self.sort = sort
+        self.on_sort = on_sort
+        self.rows = {}    # key -> slot currently on screen
+        self.order = []   # keys in on-screen order
+        self.free = []    # hidden slots ready for reuse
+
+        self.header = self.create_row(self, is_header=True)
+        self.header["frame"].pack(fill="x", pady=2)
+        for lbl, key in zip(self.header["labels"], self.sort_keys):
+            if key:
+                lbl.configure(cursor="hand2")
+                lbl.bind("<Button-1>", lambda event, key=key: self.sort_by(key))
+        self._show_sort()
+
+        self.body = ctk.CTkScrollableFrame(self, fg_color=body_color, height=height)
+        self.body.pack(fill="both", expand=True)
+
+    # --- ROW WIDGETS ---
+    def create_row(self, parent, is_header=False):
+        row_color = "#2b2b2b" if is_header else "transparent"
+        text_color = "white" if is_header else "#ddd"
+        font = ("Segoe UI", 13, "bold") if is_header else ("Segoe UI", 12)
+
+        row_frame = ctk.CTkFrame(parent, fg_color=row_color, height=40 if is_header else 35, corner_radius=5 if is_header else 0)
+        slot = {"frame": row_frame, "labels": [], "sep": None, "data": [None] * len(self.columns),
+                "key": None, "check": None}
+        offset = 0
+        if self.selectable:
+            command = self.toggle_page if is_header else lambda: self.toggle(slot)
+            slot["check"] = ctk.CTkCheckBox(row_frame, text="", width=24, checkbox_width=18, checkbox_height=18,
+                                            command=command)
+            slot["check"].grid(row=0, column=0, padx=(10, 0))
+            offset = 1
+        for col, (_, minsize, weight) in enumerate(self.columns):
+            row_frame.grid_columnconfigure(col + offset, minsize=minsize, weight=weight)
+            lbl = ctk.CTkLabel(row_frame, text="", font=font, text_color=text_color, anchor="w")
+            lbl.grid(row=0, column=col + offset, padx=10, sticky="w")
+            slot["labels"].append(lbl)
+
+        if not is_header:
+            slot["sep"] = ctk.CTkFrame(parent, fg_color="#333", height=1)
+        return slot
+
+    def fill_row(self, slot, data):
+        for col, text in enumerate(data):
+            if slot["data"][col] == text:
+                continue
+            if col == self.status_column:
+                slot["labels"][col].configure(text=text, text_color=status_color(text))
+            else:
+                slot["labels"][col].configure(text=text)
+            slot["data"][col] = text
+
+    def set_rows(self, rows):
+        new_order = [row[0] for row in rows]
+        new_keys = set(new_order)
+
+        for key in self.order:
+            if key not in new_keys:
+                slot = self.rows.pop(key)
+                slot["frame"].pack_forget()
+                slot["sep"].pack_forget()
+                self.free.append(slot)
+        kept = [key for key in self.order if key in new_keys]
+
+        for data in rows:
+            slot = self.rows.get(data[0])
+            if slot is None:
+                slot = self.free.pop() if self.free else self.create_row(self.body)
+                self.rows[data[0]] = slot
+            self.fill_row(slot, data)
+            slot["key"] = data[0]
+            self._show_check(slot)
+
+        # Only the part of the table after the first out-of-place row is re-packed.
+        start = 0
+        while start < len(kept) and kept[start] == new_order[start]:
+            start += 1
+        for key in kept[start:]:
+            self.rows[key]["frame"].pack_forget()
+            self.rows[key]["sep"].pack_forget()
+        for key in new_order[start:]:
+            self.rows[key]["frame"].pack(fill="x", pady=2)
+            self.rows[key]["sep"].pack(fill="x")
+        self.order = new_order
+        self._show_check(self.header)
+
+    def clear(self):
+        self.set_rows([])
+
+    # --- SORTING ---
+    def sort_by(self, key):
+        descending = not self.sort[1] if self.sort and self.sort[0] == key else False
+        self.sort = (key, descending)
+        self._show_sort()
+        self.sort_changed()
+
+    def sort_changed(self):
+        if self.on_sort:
+            self.on_sort(self.sort)
+
+    def _show_sort(self):
+        for lbl, column, key in zip(self.header["labels"], self.columns, self.sort_keys):
+            arrow = ""
+            if key and self.sort and self.sort[0] == key:
+                arrow = " ▼" if self.sort[1] else " ▲"
+            lbl.configure(text=column[0] + arrow)
+
+    # --- SELECTION ---
+    def toggle(self, slot):
+        if slot["check"].get():
+            self.selected.add(slot["key"])
+        else:
+            self.selected.discard(slot["key"])
+        self._show_check(self.header)
+        self._selection_changed()
+
+    def toggle_page(self):
+        """Header checkbox: selects or clears every row on screen."""
+        if self.header["check"].get():
+            self.selected.update(self.order)
+        else:
+            self.selected.difference_update(self.order)
+        for key in self.order:
+            self._show_check(self.rows[key])
+        self._selection_changed()
+
+    def clear_selection(self):
+        self.selected.clear()
+        for slot in [self.header] + [self.rows[key] for key in self.order]:
+            self._show_check(slot)
+        self._selection_changed()
+
+    def _show_check(self, slot):
+        check = slot["check"]
+        if check is None:
+            return
+        if slot is self.header:
+            wanted = bool(self.order) and self.selected.issuperset(self.order)
+        else:
+            wanted = slot["key"] in self.selected
+        if bool(check.get()) != wanted:
+            check.select() if wanted else check.deselect()
+
+    def _selection_changed(self):
+        if self.on_select:
+            self.on_select(self.selected)
+
+# --- PAGED GRID TABLE ---
+class PagedTable(DataTable):
+    """DataTable that only holds the rows of the current page.
+
+    The table does not load data itself: when the page changes it calls
+    request_page(offset, limit), and the owner answers with
+    show_page(rows, total) once the rows are loaded (possibly on a worker
+    thread). The widget count is bounded by the page size no matter how many
+    complaints there are."""
+    PAGE_SIZES = ["25", "50", "100", "200"]
+
+    def __init__(self, parent, columns, request_page, page_size=50, status_column=None,
+                 selectable=False, on_select=None, sort_keys=None, sort=None):
+        super().__init__(parent, columns, status_column=status_column, selectable=selectable, on_select=on_select,
+                         sort_keys=sort_keys, sort=sort)
+        self.request_page = request_page
+        self.page_size = page_size
+        self.page = 0
+        self.total = 0
+
+        nav = ctk.CTkFrame(self, fg_color="transparent")
+        nav.pack(fill="x", pady=(5, 0))
+        self.btn_prev = ctk.CTkButton(nav, text="◀ Prev", width=80, fg_color="#333", hover_color="#444", command=self.prev_page)
+        self.btn_prev.pack(side="left")
+        self.page_label = ctk.CTkLabel(nav, text="", text_color="#aaa", font=("Segoe UI", 12))
+        self.page_label.pack(side="left", padx=15)
+        self.btn_next = ctk.CTkButton(nav, text="Next ▶", width=80, fg_color="#333", hover_color="#444", command=self.next_page)
+        self.btn_next.pack(side="left")
+
+        self.size_menu = ctk.CTkOptionMenu(nav, values=self.PAGE_SIZES, width=80, command=self.set_page_size)
+        self.size_menu.set(str(page_size))
+        self.size_menu.pack(side="right")
+        ctk.CTkLabel(nav, text="Rows per page:", text_color="#aaa", font=("Segoe UI", 12)).pack(side="right", padx=10)
+
+    # --- PAGING ---
+    def sort_changed(self):
+        # A new order starts from the first page; request_page reads self.sort.
+        self.page = 0
+        self.refresh()
+        self.body._parent_canvas.yview_moveto(0)
+
+    def refresh(self):
+        self.request_page(self.page * self.page_size, self.page_size)
+
+    def show_page(self, rows, total):
+        self.total = total
+        last_page = max(0, (total - 1) // self.page_size)
+        if self.page > last_page:
+            # Rows were deleted from under us; step back to the last page.
+            self.page = last_page
+            self.refresh()
+            return
+        self.set_rows(rows)
+
+        self.page_label.configure(text=f"Page {self.page + 1} of {last_page + 1}  ({total} records)")
+        self.btn_prev.configure(state="normal" if self.page > 0 else "disabled")
+        self.btn_next.configure(state="normal" if self.page < last_page else "disabled")
+
+    def prev_page(self):
+        if self.page > 0:
+            self.page -= 1
+            self.refresh()
+            self.body._parent_canvas.yview_moveto(0)
+
+    def next_page(self):
+        if (self.page + 1) * self.page_size < self.total:
+            self.page += 1
+            self.refresh()
+            self.body._parent_canvas.yview_moveto(0)
+
+    def set_page_size(self, value):
+        first_row = self.page * self.page_size
+        self.page_size = int(value)
+        self.page = first_row // self.page_size
+        self.refresh()
@@ -0,0 +1,52 @@
+"""Streaming CSV / JSON Lines import and export.
+
+Both directions work one record at a time, so moving a large complaints
+file in or out never holds the whole dataset in memory. The format follows
+the file extension: .csv, or .jsonl / .ndjson."""
+import csv
+import json
+import os
+
+FIELDS = ["id", "name", "roll_no", "date", "issue", "status"]
+
+def file_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return "csv"
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Unsupported file type '{ext or path}'. Use .csv or .jsonl.")
+
+def read_rows(path):
+    """Yields one dict per complaint in the file, keyed by FIELDS."""
+    fmt = file_format(path)
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            for row in csv.DictReader(f):
+                yield {k.strip().lower(): (v or "").strip() for k, v in row.items() if k}
+            return
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{number}: {e}") from None
+            if isinstance(row, dict):
+                yield {str(k).lower(): str(v).strip() for k, v in row.items() if v is not None}
+
+def write_rows(path, records):
+    """Writes Complaint records; returns the count."""
+    fmt = file_format(path)
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f) if fmt == "csv" else None
+        if writer:
+            writer.writerow(FIELDS)
+        for record in records:
+            if writer:
+                writer.writerow(record.fields())
+            else:
+                f.write(json.dumps(dict(zip(FIELDS, record.fields()))) + "\n")
+            count += 1
+    return count
@@ -0,0 +1,220 @@
+"""Benchmarks for the storage paths and the admin table.
+
+Generates synthetic complaints_data.txt files, times every storage
+operation and reports throughput, p50/p99 latency and peak memory per call.
+Results can be written as JSON and compared against an earlier run:
+
+    python benchmark.py --sizes 1000 100000 --output before.json
+    python benchmark.py --sizes 1000 100000 --compare before.json
+
+Table build timing needs a display; without one it is reported as skipped.
+"""
+import argparse
+import collections
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from AdminSide import FileManager as TeacherManager
+from Repository import ComplaintRepository
+from Storage import TextBackend
+
+WORDS = ("wifi water electricity fan projector hostel mess library lab router "
+         "leak broken door fee portal attendance transport heater").split()
+STATUSES = ["Pending", "In Progress", "Resolved", "Rejected"]
+
+def generate(filename, rows, seed=42):
+    rng = random.Random(seed)
+    with open(filename, "w") as f:
+        for i in range(1, rows + 1):
+            issue = " ".join(rng.sample(WORDS, 3))
+            f.write(f"{i}|student {i % 5000}|R{i % 20000}|2026-{1 + i % 12:02d}-{1 + i % 28:02d}|{issue}|{rng.choice(STATUSES)}\n")
+
+# --- MEASUREMENT ---
+def measure(func, iterations):
+    """Calls func(i) `iterations` times, then once more under tracemalloc."""
+    latencies = []
+    start = time.perf_counter()
+    for i in range(iterations):
+        t = time.perf_counter()
+        func(i)
+        latencies.append(time.perf_counter() - t)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(iterations)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "ops_per_sec": round(iterations / elapsed, 2) if elapsed else None,
+        "p50_ms": round(statistics.median(latencies) * 1000, 3),
+        "p99_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 3),
+        "peak_mem_kb": round(peak / 1024, 1),
+    }
+
+def bench_text(filename, rows, iterations, rng):
+    results = {}
+    slow = max(1, min(iterations, 5))
+
+    results["load[cold]"] = measure(lambda i: ComplaintRepository(filename).refresh(), slow)
+
+    backend = TextBackend(filename, log_mode=True)
+    backend.teacher.repository.refresh()
+    rewrite = TeacherManager(filename, log_mode=False)
+    ids = list(backend.teacher.repository.records)
+
+    results["save_complaint"] = measure(lambda i: backend.save_complaint("bench", "R1", "wifi down again"), iterations)
+    results["read_all"] = measure(lambda i: collections.deque(backend.teacher.read_all(), maxlen=0), slow)
+    results["find_by_roll"] = measure(lambda i: backend.find_by_roll(f"R{rng.randrange(20000)}"), iterations)
+    results["get"] = measure(lambda i: backend.get(rng.choice(ids)), iterations)
+    results["update_status[log]"] = measure(lambda i: backend.update_status(rng.choice(ids), "Resolved"), iterations)
+    results["update_status[rewrite]"] = measure(lambda i: rewrite.update_status(rng.choice(ids), "Rejected"), slow)
+    results["delete_complaint[log]"] = measure(lambda i: backend.delete_complaint(ids.pop()), iterations)
+    results["delete_complaint[rewrite]"] = measure(lambda i: rewrite.delete_complaint(ids.pop()), slow)
+    backend.teacher.repository.refresh()  # reload after the rewrites outside the timings
+    results.update(bench_backend(backend, rows, iterations, rng))
+    return results
+
+def bench_sqlite(filename, rows, iterations, rng):
+    from SqliteStorage import SqliteBackend, migrate_text_to_sqlite
+    db = filename + ".db"
+    results = {"migrate": measure(lambda i: migrate_text_to_sqlite(filename, db), 1)}
+    backend = SqliteBackend(db)
+    ids = [str(i) for i in range(1, rows + 1)]
+    rng.shuffle(ids)
+
+    results["save_complaint"] = measure(lambda i: backend.save_complaint("bench", "R1", "wifi down again"), iterations)
+    results["find_by_roll"] = measure(lambda i: backend.find_by_roll(f"R{rng.randrange(20000)}"), iterations)
+    results["get"] = measure(lambda i: backend.get(rng.choice(ids)), iterations)
+    results["update_status"] = measure(lambda i: backend.update_status(rng.choice(ids), "Resolved"), iterations)
+    results["delete_complaint"] = measure(lambda i: backend.delete_complaint(ids.pop()), iterations)
+    results.update(bench_backend(backend, rows, iterations, rng))
+    backend.close()
+    return results
+
+def bench_backend(backend, rows, iterations, rng):
+    """Operations every backend supports, including the admin panel refresh."""
+    def admin_refresh(i):
+        backend.list_page(rng.randrange(max(1, rows - 50)), 50)
+        backend.stats()
+    return {
+        "stats": measure(lambda i: backend.stats(), iterations),
+        "list_page": measure(lambda i: backend.list_page(rng.randrange(max(1, rows - 50)), 50), iterations),
+        "search": measure(lambda i: backend.search(rng.choice(WORDS) + " pending"), iterations),
+        "query[roll prefix, by date]": measure(lambda i: backend.query(
+            roll_prefix=f"R{rng.randrange(1, 10)}", sort="date", descending=True), iterations),
+        "query[page, by name]": measure(lambda i: backend.query(
+            sort="name", offset=rng.randrange(max(1, rows - 50)), limit=50), iterations),
+        "update_status_many[100]": measure(lambda i: backend.update_status_many(
+            {str(rng.randrange(1, rows + 1)): "Resolved" for _ in range(100)}), max(1, min(iterations, 20))),
+        "admin_refresh[data]": measure(admin_refresh, iterations),
+    }
+
+def bench_ui(iterations):
+    """Times building and refreshing one page of the admin table, if a display exists."""
+    try:
+        import customtkinter as ctk
+        from TableView import PagedTable
+        root = ctk.CTk()
+    except Exception as e:
+        return {"skipped": f"{type(e).__name__}: {e}"}
+    from MainApp import ADMIN_COLUMNS
+
+    rows = [[str(i), f"R{i}", f"student {i}", "2026-01-28", STATUSES[i % 4], "wifi issue"] for i in range(50)]
+    results = {}
+    try:
+        def build(i):
+            table = PagedTable(root, ADMIN_COLUMNS, lambda offset, limit: None, status_column=4)
+            table.show_page(rows, 100000)
+            root.update_idletasks()
+            table.destroy()
+        results["admin_table_build[50 rows]"] = measure(build, max(1, min(iterations, 10)))
+
+        table = PagedTable(root, ADMIN_COLUMNS, lambda offset, limit: None, status_column=4)
+        table.show_page(rows, 100000)
+        def one_status_change(i):
+            changed = [list(r) for r in rows]
+            changed[i % 50][4] = STATUSES[(i + 1) % 4]
+            table.show_page(changed, 100000)
+            root.update_idletasks()
+        results["admin_table_refresh[1 change]"] = measure(one_status_change, iterations)
+    finally:
+        root.destroy()
+    return results
+
+# --- REPORTING ---
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+def print_report(report, baseline=None):
+    for group, ops in report["results"].items():
+        print(f"\n== {group} ==")
+        if "skipped" in ops:
+            print(f"  skipped ({ops['skipped']})")
+            continue
+        for op, m in ops.items():
+            line = f"  {op:<30} {m['ops_per_sec'] or 0:>11.1f} ops/s  p50 {m['p50_ms']:>9.3f} ms  p99 {m['p99_ms']:>9.3f} ms  peak {m['peak_mem_kb']:>9.1f} KiB"
+            old = (baseline or {}).get("results", {}).get(group, {}).get(op)
+            if old and "p50_ms" in old and old["p50_ms"]:
+                line += f"  ({(m['p50_ms'] - old['p50_ms']) / old['p50_ms'] * 100:+.1f}% p50 vs {baseline.get('commit')})"
+            print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark U-CMS storage and table rendering.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--backends", nargs="+", default=["txt", "sqlite"], choices=["txt", "sqlite"])
+    parser.add_argument("--no-ui", action="store_true", help="skip the table build timing")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="JSON from an earlier run to compare p50 latencies against")
+    args = parser.parse_args()
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": args.iterations,
+        "results": {},
+    }
+    tmp = tempfile.mkdtemp(prefix="ucms-bench-")
+    try:
+        for rows in args.sizes:
+            for kind in args.backends:
+                filename = os.path.join(tmp, f"{kind}-{rows}", "complaints_data.txt")
+                os.makedirs(os.path.dirname(filename))
+                generate(filename, rows)
+                bench = bench_text if kind == "txt" else bench_sqlite
+                print(f"Benchmarking {kind} with {rows} rows...", file=sys.stderr)
+                report["results"][f"{kind}/{rows}"] = bench(filename, rows, args.iterations, random.Random(rows))
+                shutil.rmtree(os.path.dirname(filename))
+        if not args.no_ui:
+            report["results"]["ui"] = bench_ui(args.iterations)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,128 @@
+"""Load test: many front ends sharing one `ucms serve` process versus each
+opening complaints_data.txt directly.
+
+Starts N client processes per mode against a synthetic data file. Every
+client runs the same mix as a busy desktop (track by roll, an admin page
+query, submit, status update) for a fixed time and the script reports
+requests/sec and latency per mode:
+
+    python loadtest.py --rows 50000 --clients 1 8 32 --duration 10
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmark import generate
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+STATUSES = ["Pending", "In Progress", "Resolved", "Rejected"]
+
+def client(mode, target, rows, duration, seed):
+    """One front end; returns (requests, latencies in seconds)."""
+    from Storage import open_backend
+    rng = random.Random(seed)
+    backend = open_backend(mode, target)
+    backend.stats()  # warm up (direct mode: load the file) outside the timing
+    latencies = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        op = rng.random()
+        start = time.perf_counter()
+        if op < 0.6:
+            backend.find_by_roll(f"R{rng.randrange(20000)}")
+        elif op < 0.8:
+            backend.query(status=rng.choice(STATUSES), offset=rng.randrange(max(1, rows // 8)), limit=50)
+            backend.stats()
+        elif op < 0.9:
+            backend.save_complaint("load", f"R{rng.randrange(20000)}", "wifi down again")
+        else:
+            backend.update_status(rng.randrange(1, rows + 1), rng.choice(STATUSES))
+        latencies.append(time.perf_counter() - start)
+    return len(latencies), latencies
+
+def run_clients(mode, target, rows, clients, duration):
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(clients) as pool:
+        start = time.perf_counter()
+        results = pool.starmap(client, [(mode, target, rows, duration, seed) for seed in range(clients)])
+        elapsed = time.perf_counter() - start
+    latencies = sorted(l for _, ls in results for l in ls)
+    requests = sum(n for n, _ in results)
+    return {
+        "clients": clients,
+        "requests": requests,
+        "requests_per_sec": round(requests / duration, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 3) if latencies else None,
+        "p99_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 3) if latencies else None,
+        "wall_sec": round(elapsed, 1),
+    }
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_server(filename):
+    port = free_port()
+    proc = subprocess.Popen([sys.executable, os.path.join(HERE, "ucms.py"), "--backend", "txt", "--data", filename,
+                             "serve", "--port", str(port)], stdout=subprocess.DEVNULL)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return proc, f"http://127.0.0.1:{port}"
+        except OSError:
+            if proc.poll() is not None:
+                raise RuntimeError("server exited during startup")
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("server did not start")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--duration", type=float, default=10, help="seconds per run")
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args(argv)
+
+    report = {"rows": args.rows, "duration": args.duration, "runs": []}
+    workdir = tempfile.mkdtemp(prefix="ucms-load-")
+    try:
+        for clients in args.clients:
+            for mode in ("txt", "http"):
+                # A fresh copy per run, so earlier writes do not skew the next one.
+                filename = os.path.join(workdir, f"{mode}-{clients}.txt")
+                generate(filename, args.rows)
+                server = None
+                target = filename
+                if mode == "http":
+                    server, target = start_server(filename)
+                try:
+                    result = run_clients(mode, target, args.rows, clients, args.duration)
+                finally:
+                    if server:
+                        server.terminate()
+                        server.wait()
+                result["mode"] = "server" if mode == "http" else "direct"
+                report["runs"].append(result)
+                print(f"{result['mode']:<8}{clients:>4} clients  {result['requests_per_sec']:>10.1f} req/s  "
+                      f"p50 {result['p50_ms']:>9.3f} ms  p99 {result['p99_ms']:>9.3f} ms", flush=True)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
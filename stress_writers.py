@@ -0,0 +1,90 @@
+"""Concurrency stress check for the TXT database.
+
+Spawns several processes that submit complaints and update statuses against
+one shared data file at the same time (half of them in log mode, with a tiny
+compaction threshold so compactions race with writers), then checks that no
+complaint was lost or written twice, that no ID was handed out twice and
+that every status update survived.
+
+    python stress_writers.py --procs 8 --per-proc 200
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+
+from AdminSide import FileManager as TeacherManager
+from StudentSide import FileManager as StudentManager
+
+FINAL_STATUSES = ["In Progress", "Resolved", "Rejected"]
+
+def expected_status(i, count):
+    """Worker loop step 2j+1 updates the worker's own complaint j; the rest stay Pending."""
+    return FINAL_STATUSES[i % 3] if 2 * i + 1 < count else "Pending"
+
+def worker(filename, worker_no, count, log_mode):
+    # Every worker files under its own roll number and only updates its own
+    # complaints, so the final status of each one is known in advance.
+    student = StudentManager(filename)
+    teacher = TeacherManager(filename, log_mode=log_mode, compact_min_bytes=512, compact_ratio=0.01)
+    roll = f"R{worker_no}"
+    for i in range(count):
+        if not student.save_complaint(f"worker{worker_no}", roll, f"issue {worker_no}-{i}"):
+            sys.exit(1)
+        if i % 2 == 1:
+            target = f"issue {worker_no}-{i // 2}"
+            ids = [r.id for r in teacher.find_by_roll(roll) if r.issue == target]
+            if len(ids) != 1 or not teacher.update_status(ids[0], expected_status(i // 2, count)):
+                sys.exit(1)
+    if teacher._compactor:
+        teacher._compactor.join()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--procs", type=int, default=8)
+    parser.add_argument("--per-proc", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "complaints_data.txt")
+        procs = [multiprocessing.Process(target=worker, args=(filename, n, args.per_proc, n % 2 == 0))
+                 for n in range(args.procs)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+
+        # Straight from the file lines (with the change log applied), not the
+        # cache: the cache is keyed by ID and would hide duplicates.
+        records = list(TeacherManager(filename).iter_records())
+        with open(filename, "r") as f:
+            lines = sum(1 for line in f if line.strip())
+        ids = [r.id for r in records]
+        issues = sorted(r.issue for r in records)
+        expected = sorted(f"issue {n}-{i}" for n in range(args.procs) for i in range(args.per_proc))
+        wrong_status = sum(r.status.value != expected_status(int(r.issue.rsplit("-", 1)[1]), args.per_proc)
+                           for r in records)
+
+        failures = []
+        if any(p.exitcode != 0 for p in procs):
+            failures.append("a worker process failed")
+        if lines != len(records):
+            failures.append(f"{lines - len(records)} malformed lines")
+        if len(ids) != len(set(ids)):
+            failures.append(f"{len(ids) - len(set(ids))} duplicate IDs")
+        if issues != expected:
+            missing = set(expected) - set(issues)
+            failures.append(f"{len(missing)} complaints lost, {len(issues) - len(set(issues))} written twice")
+        if wrong_status:
+            failures.append(f"{wrong_status} status updates lost")
+
+        print(f"{len(records)} records from {args.procs} processes x {args.per_proc} submissions")
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        if not failures:
+            print("OK: no lost, duplicated or re-used records and no lost updates")
+        return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
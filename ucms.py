@@ -0,0 +1,221 @@
+"""Command line interface to U-CMS.
+
+Runs without a display and never imports customtkinter, so batch jobs and
+reports start quickly on servers:
+
+    python -m ucms submit --name "Ali" --roll 23M-101 --issue "wifi down"
+    python -m ucms list --status Pending --limit 20
+    python -m ucms list --roll 23M --sort date --desc
+    python -m ucms track 23M-101
+    python -m ucms update 12 Resolved
+    python -m ucms delete 12
+    python -m ucms bulk-update Resolved 12 13 14
+    python -m ucms bulk-delete 12 13 14
+    python -m ucms import old_semester.csv
+    python -m ucms export backup.jsonl
+    python -m ucms stats --breakdown --json
+    python -m ucms archive --days 180
+    python -m ucms gui
+    python -m ucms serve --port 8765
+    python -m ucms --backend http --data http://127.0.0.1:8765 list
+"""
+import argparse
+import json
+import sys
+
+import Profiling
+from Archive import CLOSED, DEFAULT_DAYS
+from Query import SORT_COLUMNS
+from Service import ComplaintService
+from Storage import open_backend
+from Transfer import FIELDS
+
+def print_records(records, as_json):
+    if as_json:
+        print(json.dumps([dict(zip(FIELDS, r.fields())) for r in records], indent=2))
+        return
+    for r in records:
+        print("\t".join(r.fields()))
+
+def cmd_submit(service, args):
+    if not service.save_complaint(args.name, args.roll, args.issue):
+        return 1
+    print("Complaint logged.")
+    return 0
+
+def cmd_list(service, args):
+    records, total = service.query(args.query or "", args.status, args.date_from, args.date_to, args.roll,
+                                   args.sort, args.desc, args.offset, args.limit)
+    print_records(records, args.json)
+    if not args.json:
+        print(f"-- {len(records)} of {total}", file=sys.stderr)
+    return 0
+
+def cmd_track(service, args):
+    records = service.find_by_roll(args.roll)
+    print_records(records, args.json)
+    return 0 if records else 1
+
+def cmd_update(service, args):
+    if service.update_status(args.id, args.status):
+        print(f"Complaint {args.id} is now {args.status}.")
+        return 0
+    print(f"No complaint with ID {args.id}.", file=sys.stderr)
+    return 1
+
+def cmd_delete(service, args):
+    if service.delete_complaint(args.id):
+        print(f"Complaint {args.id} deleted.")
+        return 0
+    print(f"No complaint with ID {args.id}.", file=sys.stderr)
+    return 1
+
+def cmd_bulk_update(service, args):
+    updated = service.update_status_many(dict.fromkeys(args.ids, args.status))
+    print(f"{updated} of {len(set(args.ids))} complaints are now {args.status}.")
+    return 0 if updated else 1
+
+def cmd_bulk_delete(service, args):
+    deleted = service.delete_many(args.ids)
+    print(f"{deleted} of {len(set(args.ids))} complaints deleted.")
+    return 0 if deleted else 1
+
+def cmd_import(service, args):
+    imported, skipped = service.import_file(args.file)
+    print(f"Imported {imported} complaints from {args.file}" + (f", skipped {skipped} invalid rows." if skipped else "."))
+    return 0
+
+def cmd_export(service, args):
+    count = service.export_file(args.file)
+    print(f"Exported {count} complaints to {args.file}.")
+    return 0
+
+def cmd_stats(service, args):
+    stats = service.stats(args.breakdown)
+    if args.json:
+        print(json.dumps(stats, indent=2))
+        return 0
+    print(f"Total: {stats['total']}")
+    print(f"Filed today: {stats['today']}")
+    for status, count in sorted(stats["by_status"].items()):
+        print(f"{status}: {count}")
+    for key in ("by_day", "by_roll"):
+        if key in stats:
+            print(f"\n{key.replace('_', ' ').title()}:")
+            for name, count in sorted(stats[key].items()):
+                print(f"  {name}\t{count}")
+    return 0
+
+def cmd_archive(service, args):
+    moved = service.archive(args.days, args.status or CLOSED)
+    print(f"Archived {moved} complaints older than {args.days} days.")
+    return 0
+
+def cmd_gui(service, args):
+    from MainApp import ComplaintSystemApp  # only the GUI pays for customtkinter
+    ComplaintSystemApp(service, reduced_motion=args.reduced_motion or None).mainloop()
+    return 0
+
+def cmd_serve(service, args):
+    from RemoteStorage import HttpBackend
+    from Server import serve
+    if isinstance(service.backend, HttpBackend):
+        raise ValueError("The server needs a local backend (txt or sqlite) to own.")
+    serve(service, args.host, args.port)
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="ucms", description="University Complaint Management System")
+    parser.add_argument("--backend", choices=["txt", "sqlite", "http"], help="storage backend (default: $UCMS_BACKEND or txt)")
+    parser.add_argument("--data", help="data file, or server URL for http (default: $UCMS_DATA or the backend's default)")
+    parser.add_argument("--profile", action="store_true", help="time storage calls and UI handlers (also: $UCMS_PROFILE)")
+    parser.add_argument("--profile-file", default=Profiling.DEFAULT_PATH,
+                        help="where --profile writes its JSON, or a cProfile dump for .prof/.pstats")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("submit", help="file a new complaint")
+    p.add_argument("--name", required=True)
+    p.add_argument("--roll", required=True)
+    p.add_argument("--issue", required=True)
+    p.set_defaults(func=cmd_submit)
+
+    p = sub.add_parser("list", help="list or search complaints")
+    p.add_argument("--query", help="full-text search words, e.g. 'wifi pending'")
+    p.add_argument("--status")
+    p.add_argument("--from", dest="date_from", metavar="YYYY-MM-DD")
+    p.add_argument("--to", dest="date_to", metavar="YYYY-MM-DD")
+    p.add_argument("--roll", help="roll number prefix, e.g. 23M")
+    p.add_argument("--sort", choices=SORT_COLUMNS, default="id")
+    p.add_argument("--desc", action="store_true", help="sort in descending order")
+    p.add_argument("--offset", type=int, default=0)
+    p.add_argument("--limit", type=int, default=50)
+    p.add_argument("--json", action="store_true")
+    p.set_defaults(func=cmd_list)
+
+    p = sub.add_parser("track", help="show complaints for a roll number")
+    p.add_argument("roll")
+    p.add_argument("--json", action="store_true")
+    p.set_defaults(func=cmd_track)
+
+    p = sub.add_parser("update", help="change a complaint's status")
+    p.add_argument("id")
+    p.add_argument("status")
+    p.set_defaults(func=cmd_update)
+
+    p = sub.add_parser("delete", help="delete a complaint")
+    p.add_argument("id")
+    p.set_defaults(func=cmd_delete)
+
+    p = sub.add_parser("bulk-update", help="change the status of several complaints in one pass")
+    p.add_argument("status")
+    p.add_argument("ids", nargs="+", metavar="id")
+    p.set_defaults(func=cmd_bulk_update)
+
+    p = sub.add_parser("bulk-delete", help="delete several complaints in one pass")
+    p.add_argument("ids", nargs="+", metavar="id")
+    p.set_defaults(func=cmd_bulk_delete)
+
+    p = sub.add_parser("import", help="add complaints from a .csv or .jsonl file")
+    p.add_argument("file")
+    p.set_defaults(func=cmd_import)
+
+    p = sub.add_parser("export", help="write every complaint to a .csv or .jsonl file")
+    p.add_argument("file")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("stats", help="dashboard statistics")
+    p.add_argument("--breakdown", action="store_true", help="include per-day and per-roll counts")
+    p.add_argument("--json", action="store_true")
+    p.set_defaults(func=cmd_stats)
+
+    p = sub.add_parser("archive", help="move old closed complaints to compressed archive segments")
+    p.add_argument("--days", type=int, default=DEFAULT_DAYS, help=f"minimum age in days (default: {DEFAULT_DAYS})")
+    p.add_argument("--status", action="append", choices=[s.value for s in CLOSED],
+                   help="archive only this status (repeatable; default: Resolved and Rejected)")
+    p.set_defaults(func=cmd_archive)
+
+    p = sub.add_parser("gui", help="start the desktop application")
+    p.add_argument("--reduced-motion", action="store_true", help="keep the background still (thin clients, accessibility)")
+    p.set_defaults(func=cmd_gui)
+
+    p = sub.add_parser("serve", help="share one storage process and its cache with many clients over HTTP")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.set_defaults(func=cmd_serve)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.profile:
+        Profiling.enable(args.profile_file)
+    else:
+        Profiling.enable_from_env()
+    try:
+        service = ComplaintService(open_backend(args.backend, args.data))
+        return args.func(service, args)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file